@@ -1,14 +1,78 @@
 // app.js - Lógica principal de la aplicación CRUD
 
+// Registros a partir de los cuales la tabla solo renderiza las filas visibles
+const VIRTUALIZATION_THRESHOLD = 200;
+
+// Filas adicionales que se renderizan arriba y abajo de la zona visible
+const VIRTUAL_ROW_BUFFER = 10;
+
+// Alto estimado de fila hasta poder medir una fila real (px)
+const ESTIMATED_ROW_HEIGHT = 57;
+
+// Espera máxima (ms) para guardar cambios pendientes si el navegador no queda ocioso
+const SAVE_IDLE_TIMEOUT = 200;
+
+// Caracteres con significado en HTML y su entidad
+const HTML_ESCAPES = {
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;'
+};
+const HTML_ESCAPE_PATTERN = /[&<>"']/g;
+
+// Espera (ms) desde la última tecla antes de filtrar la tabla
+const SEARCH_DEBOUNCE_MS = 150;
+
 // Clase para gestionar registros
 class RecordManager {
     constructor() {
-        this.records = this.loadRecords();
+        // Los registros se cargan de forma asíncrona (ver loadRecords)
+        this.storage = null;
+        this.records = [];
+        this.recordsById = new Map();
         this.currentRecordId = null;
+        this.idGenerator = new RecordIdGenerator();
+
+        // Persistencia por lotes: versión en memoria, enviada y guardada
+        this.saveVersion = 0;
+        this.flushedVersion = 0;
+        this.persistedVersion = 0;
+        this.pendingSave = null;
+        this.persistWaiters = [];
+        this.persistFailure = null;
+        this.dirtyIds = new Set();
+        this.persisting = Promise.resolve();
+
+        // Índice ordenado de IDs (más reciente primero) y filas por ID
+        this.sortedIds = [];
+        this.rowsById = new Map();
+
+        // Tabla por ventanas para conjuntos grandes
+        this.virtualizationThreshold = VIRTUALIZATION_THRESHOLD;
+        this.rowHeight = ESTIMATED_ROW_HEIGHT;
+        this.isVirtualized = false;
+        this.scrollFrame = null;
+
+        // Paginación (pageSize 0 = todos los registros en una página)
+        this.pageSize = 0;
+        this.currentPage = 1;
+        this.visibleIds = [];
+
+        // Búsqueda: índice en memoria e IDs que coinciden (null = sin filtro)
+        this.searchIndex = new RecordSearchIndex();
+        this.searchTerm = '';
+        this.filteredIds = null;
+        this.searchTimer = null;
+
         this.initializeElements();
         this.attachEventListeners();
         this.checkAuthentication();
         this.renderTable();
+
+        // Se resuelve cuando los registros están cargados y la tabla renderizada
+        this.ready = this.loadRecords();
     }
 
     /**
@@ -36,10 +100,21 @@ class RecordManager {
         this.recordDateInput = document.getElementById('record-date');
 
         // Tabla
+        this.tableContainer = document.getElementById('table-container');
         this.tableBody = document.getElementById('table-body');
         this.emptyState = document.getElementById('empty-state');
         this.totalCount = document.getElementById('total-count');
 
+        // Búsqueda
+        this.searchInput = document.getElementById('search-input');
+        this.visibleCount = document.getElementById('visible-count');
+
+        // Paginación
+        this.pageSizeSelect = document.getElementById('page-size');
+        this.btnPrevPage = document.getElementById('btn-prev-page');
+        this.btnNextPage = document.getElementById('btn-next-page');
+        this.pageIndicator = document.getElementById('page-indicator');
+
         // Alerta
         this.alertContainer = document.getElementById('alert-container');
         this.alertMessage = document.getElementById('alert-message');
@@ -62,6 +137,29 @@ class RecordManager {
         this.btnConfirmDelete.addEventListener('click', () => this.confirmDelete());
         this.recordForm.addEventListener('submit', (e) => this.handleSubmit(e));
 
+        // Acciones de las filas: un solo listener delegado para toda la tabla
+        this.tableBody.addEventListener('click', (e) => this.handleRowAction(e));
+
+        // En modo por ventanas, renderizar las filas visibles al hacer scroll
+        this.tableContainer.addEventListener('scroll', () => this.scheduleWindowRender());
+
+        // Búsqueda mientras se escribe
+        this.searchInput.addEventListener('input', () => this.scheduleSearch());
+
+        // Paginación
+        this.pageSizeSelect.addEventListener('change', () => this.setPageSize(this.pageSizeSelect.value));
+        this.btnPrevPage.addEventListener('click', () => this.goToPage(this.currentPage - 1));
+        this.btnNextPage.addEventListener('click', () => this.goToPage(this.currentPage + 1));
+
+        // Guardar los cambios pendientes antes de salir u ocultar la página
+        window.addEventListener('beforeunload', () => this.flushRecords());
+        window.addEventListener('pagehide', () => this.flushRecords());
+        document.addEventListener('visibilitychange', () => {
+            if (document.visibilityState === 'hidden') {
+                this.flushRecords();
+            }
+        });
+
         // Cerrar modales al hacer clic fuera
         this.recordModal.addEventListener('click', (e) => {
             if (e.target === this.recordModal) {
@@ -91,50 +189,574 @@ class RecordManager {
     }
 
     /**
-     * Carga registros desde localStorage
+     * Abre el almacenamiento (IndexedDB o localStorage) y carga los registros
+     */
+    async loadRecords() {
+        // No se puede crear hasta tener los registros existentes
+        this.btnNewRecord.disabled = true;
+
+        this.storage = await openRecordStorage();
+        this.records = await this.storage.loadAll();
+
+        // Migrar registros con IDs repetidos (creados en el mismo milisegundo) o inválidos
+        const repaired = this.idGenerator.repair(this.records);
+        this.recordsById = new Map(this.records.map(r => [r.id, r]));
+        this.searchIndex.build(this.records);
+        if (repaired.length > 0) {
+            console.warn(`Se asignaron IDs nuevos a ${repaired.length} registros repetidos`);
+            this.saveRecords(repaired.flatMap(({ oldId, record }) => [oldId, record.id]));
+        }
+
+        this.renderTable();
+
+        this.btnNewRecord.disabled = false;
+        document.documentElement.setAttribute('data-storage', this.storage.name);
+        return this.storage.name;
+    }
+
+    /**
+     * Marca registros como modificados y agenda su guardado
+     * Varias modificaciones seguidas se guardan en una sola escritura
+     */
+    saveRecords(changedIds = []) {
+        changedIds.forEach(id => this.dirtyIds.add(id));
+        this.saveVersion++;
+        if (this.pendingSave !== null) return;
+
+        const flush = () => {
+            this.pendingSave = null;
+            this.flushRecords();
+        };
+        this.pendingSave = typeof requestIdleCallback === 'function'
+            ? { idle: requestIdleCallback(flush, { timeout: SAVE_IDLE_TIMEOUT }) }
+            : { timer: setTimeout(flush, 0) };
+    }
+
+    /**
+     * Envía al almacenamiento los cambios pendientes
+     * Retorna una promesa que se resuelve cuando están guardados
+     */
+    flushRecords() {
+        if (this.pendingSave !== null) {
+            if ('idle' in this.pendingSave) {
+                cancelIdleCallback(this.pendingSave.idle);
+            } else {
+                clearTimeout(this.pendingSave.timer);
+            }
+            this.pendingSave = null;
+        }
+
+        if (this.flushedVersion === this.saveVersion) return this.persisting;
+
+        // Los cambios se toman ahora; las escrituras se encadenan en orden
+        const version = this.saveVersion;
+        const changes = new Map();
+        this.dirtyIds.forEach(id => changes.set(id, this.recordsById.get(id) || null));
+        this.dirtyIds.clear();
+        this.flushedVersion = version;
+
+        const records = this.records;
+        this.persisting = this.persisting
+            .then(() => this.storage.saveChanges(changes, records))
+            .then(() => this.markPersisted(version))
+            .catch(error => {
+                console.error('No se pudieron guardar los registros:', error);
+                this.showAlert('No se pudieron guardar los cambios', 'error');
+                this.markPersistFailed(version, error);
+            });
+        return this.persisting;
+    }
+
+    /**
+     * Registra que una escritura falló y rechaza a quienes la esperan
      */
-    loadRecords() {
-        const stored = localStorage.getItem('records');
-        return stored ? JSON.parse(stored) : [];
+    markPersistFailed(version, error) {
+        this.persistFailure = { version, error };
+
+        const waiting = this.persistWaiters.filter(waiter => waiter.version <= version);
+        this.persistWaiters = this.persistWaiters.filter(waiter => waiter.version > version);
+        waiting.forEach(waiter => waiter.reject(error));
     }
 
     /**
-     * Guarda registros en localStorage
+     * Registra una versión como guardada y avisa a quienes la esperan
      */
-    saveRecords() {
-        localStorage.setItem('records', JSON.stringify(this.records));
+    markPersisted(version) {
+        this.persistedVersion = version;
+
+        const waiting = this.persistWaiters.filter(waiter => waiter.version <= version);
+        this.persistWaiters = this.persistWaiters.filter(waiter => waiter.version > version);
+        waiting.forEach(waiter => waiter.resolve(version));
+
+        window.dispatchEvent(new CustomEvent('records-persisted', {
+            detail: { version: version }
+        }));
     }
 
     /**
-     * Genera un ID único
+     * Verifica si hay cambios sin guardar
+     */
+    hasPendingChanges() {
+        return this.persistedVersion !== this.saveVersion;
+    }
+
+    /**
+     * Retorna una promesa que se resuelve cuando todos los cambios
+     * actuales están guardados, o se rechaza si su escritura falla
+     */
+    whenPersisted() {
+        if (!this.hasPendingChanges()) {
+            return Promise.resolve(this.persistedVersion);
+        }
+        const version = this.saveVersion;
+        // La última escritura falló y no hay cambios nuevos que reintentar
+        if (this.persistFailure && this.persistFailure.version === version) {
+            return Promise.reject(this.persistFailure.error);
+        }
+        return new Promise((resolve, reject) => {
+            this.persistWaiters.push({ version, resolve, reject });
+        });
+    }
+
+    /**
+     * Genera un ID único y mayor que todos los existentes
      */
     generateId() {
-        return Date.now().toString();
+        return this.idGenerator.next();
     }
 
     /**
-     * Renderiza la tabla de registros
+     * Compara dos IDs para ordenar del más reciente al más antiguo
+     */
+    compareIds(a, b) {
+        return Number(b) - Number(a);
+    }
+
+    /**
+     * Busca la posición de un ID en una lista ordenada de IDs (búsqueda binaria)
+     * Retorna la posición donde está o donde debería insertarse
+     */
+    findSortedPosition(id, ids = this.sortedIds) {
+        let low = 0;
+        let high = ids.length;
+
+        while (low < high) {
+            const middle = (low + high) >>> 1;
+            if (this.compareIds(ids[middle], id) < 0) {
+                low = middle + 1;
+            } else {
+                high = middle;
+            }
+        }
+
+        return low;
+    }
+
+    /**
+     * Renderiza la tabla completa (carga inicial o cambio de modo)
      */
     renderTable() {
+        // Ordenar por ID (más reciente primero)
+        this.sortedIds = this.records.map(r => r.id).sort((a, b) => this.compareIds(a, b));
+        this.filterRecords();
+        this.renderRows();
+    }
+
+    /**
+     * Renderiza las filas de la página actual (todas si no hay paginación)
+     */
+    renderRows() {
         this.tableBody.innerHTML = '';
+        this.rowsById.clear();
+
+        this.currentPage = Math.min(this.currentPage, this.getPageCount());
+        this.visibleIds = this.getPageIds();
 
-        if (this.records.length === 0) {
-            this.emptyState.classList.remove('hidden');
-            this.totalCount.textContent = '0';
+        this.isVirtualized = this.visibleIds.length > this.virtualizationThreshold;
+        this.tableContainer.classList.toggle('virtualized', this.isVirtualized);
+
+        if (this.isVirtualized) {
+            this.renderWindow();
+        } else {
+            const fragment = document.createDocumentFragment();
+            this.visibleIds.forEach(id => {
+                const row = this.createTableRow(this.recordsById.get(id));
+                this.rowsById.set(id, row);
+                fragment.appendChild(row);
+            });
+            this.tableBody.appendChild(fragment);
+        }
+
+        this.updateSummary();
+        this.updatePagination();
+    }
+
+    /**
+     * Obtiene los IDs de la lista actual en el orden de la tabla:
+     * los que coinciden con la búsqueda, o todos
+     */
+    getListIds() {
+        return this.filteredIds !== null ? this.filteredIds : this.sortedIds;
+    }
+
+    /**
+     * Verifica si la tabla está filtrada por una búsqueda
+     */
+    isFiltered() {
+        return this.filteredIds !== null;
+    }
+
+    /**
+     * Agenda la búsqueda para cuando el usuario deje de escribir
+     */
+    scheduleSearch() {
+        clearTimeout(this.searchTimer);
+        this.searchTimer = setTimeout(() => {
+            this.searchTimer = null;
+            this.applySearch(this.searchInput.value);
+        }, SEARCH_DEBOUNCE_MS);
+    }
+
+    /**
+     * Filtra la tabla por un término y vuelve a la primera página
+     * Retorna el número de registros que coinciden
+     */
+    applySearch(term) {
+        this.searchTerm = String(term || '').trim();
+        this.currentPage = 1;
+        this.tableContainer.scrollTop = 0;
+        this.filterRecords();
+        this.renderRows();
+
+        // Señal para las pruebas: término ya aplicado a la tabla
+        this.visibleCount.setAttribute('data-term', this.searchTerm);
+        return this.getListIds().length;
+    }
+
+    /**
+     * Recalcula los IDs que coinciden con la búsqueda actual, en el orden de la tabla
+     */
+    filterRecords() {
+        const matches = this.searchIndex.search(this.searchTerm);
+        if (matches === null) {
+            this.filteredIds = null;
             return;
         }
 
-        this.emptyState.classList.add('hidden');
+        // Pocos resultados: ordenarlos; muchos: recorrer el índice ordenado
+        this.filteredIds = matches.size * 8 < this.sortedIds.length
+            ? [...matches].sort((a, b) => this.compareIds(a, b))
+            : this.sortedIds.filter(id => matches.has(id));
+    }
 
-        // Ordenar por ID (más reciente primero)
-        const sortedRecords = [...this.records].sort((a, b) => b.id - a.id);
+    /**
+     * Verifica si la tabla está paginada (pageSize 0 = todos los registros)
+     */
+    isPaginated() {
+        return this.pageSize > 0;
+    }
+
+    /**
+     * Obtiene el número de páginas
+     */
+    getPageCount() {
+        if (!this.isPaginated()) return 1;
+        return Math.max(1, Math.ceil(this.getListIds().length / this.pageSize));
+    }
+
+    /**
+     * Obtiene los IDs de la página actual en el orden de la tabla
+     */
+    getPageIds() {
+        const ids = this.getListIds();
+        if (!this.isPaginated()) return ids;
+
+        const start = (this.currentPage - 1) * this.pageSize;
+        return ids.slice(start, start + this.pageSize);
+    }
+
+    /**
+     * Muestra una página de la tabla
+     * Retorna el número de página mostrado
+     */
+    goToPage(page) {
+        const target = Math.min(Math.max(1, parseInt(page, 10) || 1), this.getPageCount());
+        if (target !== this.currentPage) {
+            this.currentPage = target;
+            this.tableContainer.scrollTop = 0;
+            this.renderRows();
+        }
+        return this.currentPage;
+    }
+
+    /**
+     * Cambia el número de registros por página y vuelve a la primera página
+     */
+    setPageSize(size) {
+        this.pageSize = Math.max(0, parseInt(size, 10) || 0);
+        this.pageSizeSelect.value = String(this.pageSize);
+        this.currentPage = 1;
+        this.tableContainer.scrollTop = 0;
+        this.renderRows();
+    }
+
+    /**
+     * Actualiza el indicador de página y los botones anterior/siguiente
+     */
+    updatePagination() {
+        const pageCount = this.getPageCount();
+        this.pageIndicator.textContent = `Página ${this.currentPage} de ${pageCount}`;
+        this.btnPrevPage.disabled = this.currentPage <= 1;
+        this.btnNextPage.disabled = this.currentPage >= pageCount;
+    }
+
+    /**
+     * Consulta registros filtrados, ordenados y paginados sin tocar el DOM
+     *
+     * Opciones: search (texto en nombre, descripción o categoría), category,
+     * sortBy (id, name, category, date), order (asc, desc),
+     * page (desde 1) y pageSize (0 = todos)
+     */
+    query({ search = '', category = '', sortBy = 'id', order = 'desc', page = 1, pageSize = 0 } = {}) {
+        const matches = this.searchIndex.search(search);
+        let ids = this.sortedIds;
+
+        if (matches !== null || category) {
+            ids = ids.filter(id => {
+                if (matches !== null && !matches.has(id)) return false;
+                return !category || this.recordsById.get(id).category === category;
+            });
+        }
+
+        if (sortBy !== 'id') {
+            // Orden estable: a igual valor se mantiene el más reciente primero
+            const direction = order === 'asc' ? 1 : -1;
+            ids = [...ids].sort((a, b) => {
+                const valueA = String(this.recordsById.get(a)[sortBy] || '');
+                const valueB = String(this.recordsById.get(b)[sortBy] || '');
+                return direction * valueA.localeCompare(valueB) || this.compareIds(a, b);
+            });
+        } else if (order === 'asc') {
+            ids = [...ids].reverse();
+        }
+
+        const total = ids.length;
+        const size = Math.max(0, parseInt(pageSize, 10) || 0);
+        const pageCount = size > 0 ? Math.max(1, Math.ceil(total / size)) : 1;
+        const current = Math.min(Math.max(1, parseInt(page, 10) || 1), pageCount);
+        const start = size > 0 ? (current - 1) * size : 0;
+        const pageIds = size > 0 ? ids.slice(start, start + size) : ids;
+
+        return {
+            total: total,
+            page: current,
+            pageSize: size,
+            pageCount: pageCount,
+            records: pageIds.map(id => this.recordsById.get(id))
+        };
+    }
+
+    /**
+     * Verifica si el número de registros exige cambiar de modo de tabla
+     */
+    needsModeChange() {
+        return (this.records.length > this.virtualizationThreshold) !== this.isVirtualized;
+    }
+
+    /**
+     * Renderiza solo las filas visibles más un margen, con espaciadores
+     * que conservan el alto total de la tabla
+     */
+    renderWindow() {
+        const total = this.visibleIds.length;
+        const scrollTop = this.tableContainer.scrollTop;
+        const viewportHeight = this.tableContainer.clientHeight || window.innerHeight;
+
+        const first = Math.max(0, Math.floor(scrollTop / this.rowHeight) - VIRTUAL_ROW_BUFFER);
+        const last = Math.min(total, Math.ceil((scrollTop + viewportHeight) / this.rowHeight) + VIRTUAL_ROW_BUFFER);
+
+        const previousRows = this.rowsById;
+        this.rowsById = new Map();
+
+        const fragment = document.createDocumentFragment();
+        fragment.appendChild(this.createSpacerRow(first * this.rowHeight));
+        for (let i = first; i < last; i++) {
+            const id = this.visibleIds[i];
+            // Reutilizar las filas que siguen dentro de la ventana
+            const row = previousRows.get(id) || this.createTableRow(this.recordsById.get(id));
+            this.rowsById.set(id, row);
+            fragment.appendChild(row);
+        }
+        fragment.appendChild(this.createSpacerRow((total - last) * this.rowHeight));
+
+        this.tableBody.replaceChildren(fragment);
+        this.measureRowHeight();
+    }
+
+    /**
+     * Mide el alto real de una fila y vuelve a renderizar si difiere del estimado
+     */
+    measureRowHeight() {
+        const firstRow = this.tableBody.querySelector('tr[data-id]');
+        if (!firstRow) return;
+
+        const height = firstRow.getBoundingClientRect().height;
+        if (height > 0 && Math.abs(height - this.rowHeight) > 0.5) {
+            this.rowHeight = height;
+            this.renderWindow();
+        }
+    }
 
-        sortedRecords.forEach(record => {
-            const row = this.createTableRow(record);
-            this.tableBody.appendChild(row);
+    /**
+     * Agenda un renderizado de la ventana para el próximo frame
+     */
+    scheduleWindowRender() {
+        if (!this.isVirtualized || this.scrollFrame !== null) return;
+
+        this.scrollFrame = requestAnimationFrame(() => {
+            this.scrollFrame = null;
+            this.renderWindow();
         });
+    }
 
+    /**
+     * Crea una fila vacía que ocupa el alto de las filas no renderizadas
+     */
+    createSpacerRow(height) {
+        const tr = document.createElement('tr');
+        tr.className = 'virtual-spacer';
+        tr.setAttribute('aria-hidden', 'true');
+        tr.innerHTML = `<td colspan="6" style="height: ${height}px"></td>`;
+        return tr;
+    }
+
+    /**
+     * Muestra la página de un registro y desplaza la tabla hasta él
+     * Retorna false si el registro no existe
+     */
+    scrollToRecord(id) {
+        // Solo se puede mostrar si está en la lista actual (coincide con la búsqueda)
+        const ids = this.getListIds();
+        const position = this.findSortedPosition(id, ids);
+        if (ids[position] !== id) return false;
+
+        let index = position;
+        if (this.isPaginated()) {
+            this.goToPage(Math.floor(position / this.pageSize) + 1);
+            index = position - (this.currentPage - 1) * this.pageSize;
+        }
+
+        if (this.isVirtualized) {
+            const viewportHeight = this.tableContainer.clientHeight || window.innerHeight;
+            this.tableContainer.scrollTop = Math.max(0, index * this.rowHeight - viewportHeight / 2);
+            this.renderWindow();
+        }
+
+        const row = this.rowsById.get(id);
+        if (row) {
+            row.scrollIntoView({ block: 'center' });
+        }
+        return Boolean(row);
+    }
+
+    /**
+     * Inserta solo la fila de un registro nuevo en su posición
+     */
+    insertRow(record) {
+        const position = this.findSortedPosition(record.id);
+
+        if (this.isPaginated() || this.isFiltered()) {
+            // La inserción desplaza las páginas siguientes o puede no coincidir
+            // con la búsqueda: se renderiza solo la página actual
+            this.sortedIds.splice(position, 0, record.id);
+            this.filterRecords();
+            this.renderRows();
+            return;
+        }
+
+        if (this.needsModeChange()) {
+            this.renderTable();
+            return;
+        }
+
+        this.sortedIds.splice(position, 0, record.id);
+
+        if (this.isVirtualized) {
+            this.renderWindow();
+            this.updateSummary();
+            return;
+        }
+
+        const row = this.createTableRow(record);
+        const nextId = this.sortedIds[position + 1];
+        this.tableBody.insertBefore(row, nextId !== undefined ? this.rowsById.get(nextId) : null);
+        this.rowsById.set(record.id, row);
+
+        this.updateSummary();
+    }
+
+    /**
+     * Reemplaza solo la fila de un registro actualizado
+     */
+    patchRow(record) {
+        if (this.isFiltered()) {
+            // El registro editado puede dejar de coincidir con la búsqueda
+            this.filterRecords();
+            this.renderRows();
+            return;
+        }
+
+        const oldRow = this.rowsById.get(record.id);
+        if (!oldRow) return;
+
+        const row = this.createTableRow(record);
+        oldRow.replaceWith(row);
+        this.rowsById.set(record.id, row);
+    }
+
+    /**
+     * Elimina solo la fila de un registro borrado
+     */
+    removeRow(id) {
+        const position = this.findSortedPosition(id);
+        const exists = this.sortedIds[position] === id;
+
+        if (this.isPaginated() || this.isFiltered()) {
+            if (exists) this.sortedIds.splice(position, 1);
+            this.filterRecords();
+            this.renderRows();
+            return;
+        }
+
+        if (this.needsModeChange()) {
+            this.renderTable();
+            return;
+        }
+
+        if (exists) {
+            this.sortedIds.splice(position, 1);
+        }
+
+        if (this.isVirtualized) {
+            this.renderWindow();
+        } else {
+            const row = this.rowsById.get(id);
+            if (row) {
+                row.remove();
+                this.rowsById.delete(id);
+            }
+        }
+
+        this.updateSummary();
+    }
+
+    /**
+     * Actualiza el estado vacío y el contador total
+     */
+    updateSummary() {
+        this.emptyState.classList.toggle('hidden', this.records.length > 0);
         this.totalCount.textContent = this.records.length;
+        this.visibleCount.textContent = this.getListIds().length;
     }
 
     /**
@@ -160,23 +782,31 @@ class RecordManager {
             </td>
         `;
 
-        // Event listeners para botones
-        const btnEdit = tr.querySelector('.btn-edit');
-        const btnDelete = tr.querySelector('.btn-delete');
-
-        btnEdit.addEventListener('click', () => this.openEditModal(record.id));
-        btnDelete.addEventListener('click', () => this.openDeleteModal(record.id));
-
         return tr;
     }
 
+    /**
+     * Despacha los clics en los botones de las filas según data-id y clase
+     */
+    handleRowAction(event) {
+        const button = event.target.closest('button[data-id]');
+        if (!button) return;
+
+        const id = button.getAttribute('data-id');
+        if (button.classList.contains('btn-edit')) {
+            this.openEditModal(id);
+        } else if (button.classList.contains('btn-delete')) {
+            this.openDeleteModal(id);
+        }
+    }
+
     /**
      * Escapa HTML para prevenir XSS
+     * Trabaja sobre el string, sin crear nodos del DOM en cada llamada
      */
     escapeHtml(text) {
-        const div = document.createElement('div');
-        div.textContent = text;
-        return div.innerHTML;
+        if (text === null || text === undefined) return '';
+        return String(text).replace(HTML_ESCAPE_PATTERN, char => HTML_ESCAPES[char]);
     }
 
     /**
@@ -200,7 +830,7 @@ class RecordManager {
      * Abre modal para editar registro
      */
     openEditModal(id) {
-        const record = this.records.find(r => r.id === id);
+        const record = this.recordsById.get(id);
         if (!record) return;
 
         this.modalTitle.textContent = 'Editar Registro';
@@ -309,8 +939,10 @@ class RecordManager {
         };
 
         this.records.push(newRecord);
-        this.saveRecords();
-        this.renderTable();
+        this.recordsById.set(newRecord.id, newRecord);
+        this.searchIndex.add(newRecord);
+        this.saveRecords([newRecord.id]);
+        this.insertRow(newRecord);
         this.closeRecordModal();
         this.showAlert('Registro creado exitosamente', 'success');
     }
@@ -330,9 +962,11 @@ class RecordManager {
             date: data.date,
             updatedAt: new Date().toISOString()
         };
+        this.recordsById.set(id, this.records[index]);
+        this.searchIndex.update(this.records[index]);
 
-        this.saveRecords();
-        this.renderTable();
+        this.saveRecords([id]);
+        this.patchRow(this.records[index]);
         this.closeRecordModal();
         this.showAlert('Registro actualizado exitosamente', 'success');
     }
@@ -343,9 +977,12 @@ class RecordManager {
     confirmDelete() {
         if (!this.currentRecordId) return;
 
-        this.records = this.records.filter(r => r.id !== this.currentRecordId);
-        this.saveRecords();
-        this.renderTable();
+        const id = this.currentRecordId;
+        this.records = this.records.filter(r => r.id !== id);
+        this.recordsById.delete(id);
+        this.searchIndex.remove(id);
+        this.saveRecords([id]);
+        this.removeRow(id);
         this.closeDeleteModal();
         this.showAlert('Registro eliminado exitosamente', 'success');
     }
@@ -373,5 +1010,8 @@ class RecordManager {
 
 // Inicializar la aplicación cuando el DOM esté listo
 document.addEventListener('DOMContentLoaded', () => {
-    new RecordManager();
+    window.recordManager = new RecordManager();
+
+    // Consulta de registros sin pasar por la tabla (ver RecordManager.query)
+    window.queryRecords = (options) => window.recordManager.query(options);
 });
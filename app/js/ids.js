@@ -0,0 +1,57 @@
+// ids.js - IDs de registros únicos, crecientes y ordenables numéricamente
+
+// Un ID válido es un entero positivo representable sin pérdida en JavaScript
+function isValidRecordId(id) {
+    return typeof id === 'string' && /^\d+$/.test(id) && Number.isSafeInteger(Number(id));
+}
+
+// Genera IDs basados en Date.now() que nunca se repiten: si varios registros
+// se crean en el mismo milisegundo (o el reloj retrocede), el siguiente ID es
+// el último más uno
+class RecordIdGenerator {
+    constructor() {
+        this.lastId = 0;
+    }
+
+    /**
+     * Genera el siguiente ID
+     */
+    next() {
+        const id = Math.max(Date.now(), this.lastId + 1);
+        this.lastId = id;
+        return String(id);
+    }
+
+    /**
+     * Registra un ID existente para que los siguientes sean mayores
+     */
+    observe(id) {
+        const value = Number(id);
+        if (Number.isSafeInteger(value) && value > this.lastId) {
+            this.lastId = value;
+        }
+    }
+
+    /**
+     * Asigna un ID nuevo a los registros con ID repetido o inválido
+     * (conserva el ID del primero de cada grupo repetido)
+     *
+     * Retorna la lista de cambios como { oldId, record }
+     */
+    repair(records) {
+        records.forEach(record => this.observe(record.id));
+
+        const seen = new Set();
+        const repaired = [];
+        records.forEach(record => {
+            if (!isValidRecordId(record.id) || seen.has(record.id)) {
+                const oldId = record.id;
+                record.id = this.next();
+                repaired.push({ oldId, record });
+            }
+            seen.add(record.id);
+        });
+
+        return repaired;
+    }
+}
@@ -6,6 +6,11 @@ const VALID_CREDENTIALS = {
     password: 'admin123'
 };
 
+// Espera antes de redirigir tras un login exitoso (ms). Se puede cambiar con
+// ?redirectDelay=0 o con window.LOGIN_CONFIG = { redirectDelay: 0 }
+const DEFAULT_REDIRECT_DELAY = 1000;
+const REDIRECT_TARGET = 'index.html';
+
 // Contador de intentos fallidos
 let failedAttempts = 0;
 
@@ -74,10 +79,55 @@ function handleSuccessfulLogin(username) {
     // Mostrar mensaje de éxito
     showAlert('Inicio de sesión exitoso. Redirigiendo...', 'success');
 
-    // Redirigir después de un breve delay
-    setTimeout(() => {
-        window.location.href = 'index.html';
-    }, 1000);
+    scheduleRedirect(REDIRECT_TARGET);
+}
+
+/**
+ * Obtiene la espera antes de redirigir: primero el parámetro redirectDelay
+ * de la URL, luego window.LOGIN_CONFIG.redirectDelay y si no, el valor por defecto
+ * @returns {number} Milisegundos de espera
+ */
+function getRedirectDelay() {
+    const candidates = [
+        new URLSearchParams(window.location.search).get('redirectDelay'),
+        window.LOGIN_CONFIG && window.LOGIN_CONFIG.redirectDelay
+    ];
+
+    for (const value of candidates) {
+        if (value === null || value === undefined || value === '') continue;
+        const delay = Number(value);
+        if (Number.isFinite(delay) && delay >= 0) {
+            return delay;
+        }
+    }
+    return DEFAULT_REDIRECT_DELAY;
+}
+
+/**
+ * Marca la página como lista para redirigir y redirige tras la espera configurada
+ *
+ * La señal (atributo data-redirect-ready y evento login-redirect-ready) se
+ * emite con la alerta de éxito ya visible. Sin espera, la redirección se hace
+ * después de pintar la alerta para que siga siendo observable.
+ * @param {string} target - Página de destino
+ */
+function scheduleRedirect(target) {
+    const delay = getRedirectDelay();
+
+    document.documentElement.dataset.redirectReady = target;
+    window.dispatchEvent(new CustomEvent('login-redirect-ready', {
+        detail: { target, delay }
+    }));
+
+    const redirect = () => {
+        window.location.href = target;
+    };
+
+    if (delay > 0) {
+        setTimeout(redirect, delay);
+    } else {
+        requestAnimationFrame(() => setTimeout(redirect, 0));
+    }
 }
 
 /**
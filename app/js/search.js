@@ -0,0 +1,124 @@
+// search.js - Índice en memoria para buscar registros por nombre, descripción y categoría
+
+// Longitud de los fragmentos indexados (trigramas)
+const SEARCH_GRAM_SIZE = 3;
+
+/**
+ * Normaliza un texto para buscar: minúsculas y sin acentos
+ */
+function normalizeSearchText(text) {
+    return String(text || '')
+        .normalize('NFD')
+        .replace(/[\u0300-\u036f]/g, '')
+        .toLowerCase();
+}
+
+/**
+ * Obtiene los trigramas distintos de un texto normalizado
+ */
+function searchGrams(text) {
+    const grams = new Set();
+    for (let i = 0; i + SEARCH_GRAM_SIZE <= text.length; i++) {
+        grams.add(text.slice(i, i + SEARCH_GRAM_SIZE));
+    }
+    return grams;
+}
+
+// Índice invertido de trigramas a IDs. Cada cambio de un registro actualiza
+// solo sus entradas; una búsqueda intersecta las listas de sus trigramas y
+// confirma los candidatos con una comparación de texto
+class RecordSearchIndex {
+    constructor() {
+        this.textById = new Map();
+        this.idsByGram = new Map();
+    }
+
+    /**
+     * Reconstruye el índice con todos los registros
+     */
+    build(records) {
+        this.textById.clear();
+        this.idsByGram.clear();
+        records.forEach(record => this.add(record));
+    }
+
+    /**
+     * Indexa un registro
+     */
+    add(record) {
+        const text = normalizeSearchText(
+            `${record.name || ''}\n${record.description || ''}\n${record.category || ''}`
+        );
+        this.textById.set(record.id, text);
+
+        searchGrams(text).forEach(gram => {
+            let ids = this.idsByGram.get(gram);
+            if (!ids) {
+                ids = new Set();
+                this.idsByGram.set(gram, ids);
+            }
+            ids.add(record.id);
+        });
+    }
+
+    /**
+     * Quita un registro del índice
+     */
+    remove(id) {
+        const text = this.textById.get(id);
+        if (text === undefined) return;
+
+        searchGrams(text).forEach(gram => {
+            const ids = this.idsByGram.get(gram);
+            ids.delete(id);
+            if (ids.size === 0) {
+                this.idsByGram.delete(gram);
+            }
+        });
+        this.textById.delete(id);
+    }
+
+    /**
+     * Reindexa un registro modificado
+     */
+    update(record) {
+        this.remove(record.id);
+        this.add(record);
+    }
+
+    /**
+     * Busca los registros cuyo texto contiene el término
+     * Retorna un Set de IDs, o null si el término está vacío (sin filtro)
+     */
+    search(term) {
+        const needle = normalizeSearchText(term).trim();
+        if (!needle) return null;
+
+        const matches = new Set();
+
+        // Términos cortos no tienen trigramas: se recorre el texto indexado
+        if (needle.length < SEARCH_GRAM_SIZE) {
+            this.textById.forEach((text, id) => {
+                if (text.includes(needle)) matches.add(id);
+            });
+            return matches;
+        }
+
+        // Empezar por el trigrama con menos registros
+        const postings = [];
+        for (const gram of searchGrams(needle)) {
+            const ids = this.idsByGram.get(gram);
+            if (!ids) return matches;
+            postings.push(ids);
+        }
+        postings.sort((a, b) => a.size - b.size);
+
+        const [smallest, ...rest] = postings;
+        smallest.forEach(id => {
+            if (rest.every(ids => ids.has(id)) && this.textById.get(id).includes(needle)) {
+                matches.add(id);
+            }
+        });
+        return matches;
+    }
+}
@@ -0,0 +1,179 @@
+// storage.js - Almacenamiento de registros: IndexedDB con respaldo en localStorage
+
+// Base de datos IndexedDB: un objeto por registro, con índices por nombre y categoría
+const DB_NAME = 'records-db';
+const DB_VERSION = 1;
+const STORE_NAME = 'records';
+
+// Clave usada por el almacenamiento en localStorage (formato original)
+const LEGACY_STORAGE_KEY = 'records';
+
+/**
+ * Convierte un IDBRequest en una promesa
+ */
+function requestToPromise(request) {
+    return new Promise((resolve, reject) => {
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+/**
+ * Convierte una transacción en una promesa que se resuelve al confirmarse
+ */
+function transactionToPromise(transaction) {
+    return new Promise((resolve, reject) => {
+        transaction.oncomplete = () => resolve();
+        transaction.onerror = () => reject(transaction.error);
+        transaction.onabort = () => reject(transaction.error);
+    });
+}
+
+// Backend en localStorage: todos los registros en un único string JSON
+class LocalStorageBackend {
+    constructor() {
+        this.name = 'localStorage';
+    }
+
+    /**
+     * Abre el almacenamiento
+     */
+    async open() {
+        return this;
+    }
+
+    /**
+     * Carga todos los registros
+     */
+    async loadAll() {
+        const stored = localStorage.getItem(LEGACY_STORAGE_KEY);
+        return stored ? JSON.parse(stored) : [];
+    }
+
+    /**
+     * Guarda los cambios; localStorage solo permite reescribir la lista completa
+     */
+    async saveChanges(changes, records) {
+        localStorage.setItem(LEGACY_STORAGE_KEY, JSON.stringify(records));
+    }
+
+    /**
+     * Reemplaza todos los registros
+     */
+    async replaceAll(records) {
+        localStorage.setItem(LEGACY_STORAGE_KEY, JSON.stringify(records));
+    }
+
+    /**
+     * Cierra el almacenamiento
+     */
+    close() {}
+}
+
+// Backend en IndexedDB: cada cambio escribe solo los registros afectados
+class IndexedDBBackend {
+    constructor() {
+        this.name = 'indexedDB';
+        this.db = null;
+    }
+
+    /**
+     * Abre (o crea) la base de datos
+     */
+    async open() {
+        const request = indexedDB.open(DB_NAME, DB_VERSION);
+
+        request.onupgradeneeded = () => {
+            const store = request.result.createObjectStore(STORE_NAME, { keyPath: 'id' });
+            store.createIndex('name', 'name', { unique: false });
+            store.createIndex('category', 'category', { unique: false });
+        };
+
+        this.db = await requestToPromise(request);
+
+        // Liberar la conexión si otra pestaña (o una prueba) borra o actualiza la base
+        this.db.onversionchange = () => this.close();
+        return this;
+    }
+
+    /**
+     * Carga todos los registros, migrando los de localStorage la primera vez
+     */
+    async loadAll() {
+        const transaction = this.db.transaction(STORE_NAME, 'readonly');
+        const records = await requestToPromise(transaction.objectStore(STORE_NAME).getAll());
+
+        const legacy = localStorage.getItem(LEGACY_STORAGE_KEY);
+        if (records.length === 0 && legacy) {
+            // Los IDs repetidos se sobrescribirían entre sí en el almacén
+            const migrated = JSON.parse(legacy);
+            new RecordIdGenerator().repair(migrated);
+            await this.replaceAll(migrated);
+            localStorage.removeItem(LEGACY_STORAGE_KEY);
+            return migrated;
+        }
+
+        return records;
+    }
+
+    /**
+     * Guarda los cambios en una sola transacción
+     *
+     * changes es un Map de ID a registro (o null si el registro se eliminó)
+     */
+    async saveChanges(changes) {
+        const transaction = this.db.transaction(STORE_NAME, 'readwrite');
+        const store = transaction.objectStore(STORE_NAME);
+
+        changes.forEach((record, id) => {
+            if (record) {
+                store.put(record);
+            } else {
+                store.delete(id);
+            }
+        });
+
+        await transactionToPromise(transaction);
+    }
+
+    /**
+     * Reemplaza todos los registros
+     */
+    async replaceAll(records) {
+        const transaction = this.db.transaction(STORE_NAME, 'readwrite');
+        const store = transaction.objectStore(STORE_NAME);
+
+        store.clear();
+        records.forEach(record => store.put(record));
+
+        await transactionToPromise(transaction);
+    }
+
+    /**
+     * Cierra la conexión
+     */
+    close() {
+        if (this.db) {
+            this.db.close();
+            this.db = null;
+        }
+    }
+}
+
+/**
+ * Abre el almacenamiento de registros: IndexedDB si está disponible,
+ * si no localStorage. Se puede forzar con ?storage=localStorage
+ */
+async function openRecordStorage() {
+    const preferred = new URLSearchParams(window.location.search).get('storage');
+
+    if (preferred !== 'localStorage' && typeof indexedDB !== 'undefined') {
+        try {
+            return await new IndexedDBBackend().open();
+        } catch (error) {
+            console.warn('IndexedDB no disponible, se usa localStorage:', error);
+        }
+    }
+
+    return new LocalStorageBackend().open();
+}
@@ -4,53 +4,378 @@ conftest.py - Configuración simplificada de pytest
 
 import pytest
 import os
-from datetime import datetime
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from pathlib import Path
 
+from pages.login_page import LoginPage
+from pages.crud_page import CRUDPage
+from utils.browser_pool import CLEAR_STORAGE_SCRIPT, BrowserPool
+from utils.screenshots import (
+    CapturePolicy,
+    capture_screenshot,
+    configure_capture_policy,
+    get_capture_policy,
+    get_screenshot_store,
+    get_screenshot_writer,
+)
+from utils.driver_profiles import (
+    DEFAULT_PROFILE,
+    PROFILE_ENV_VAR,
+    PROFILES,
+    build_chrome_options,
+    resolve_profile_name,
+)
+from utils.benchmark import (
+    DEFAULT_RESULTS_PATH,
+    configure_benchmark_recorder,
+    get_benchmark_recorder,
+)
+from utils.timing import (
+    breakdown_html,
+    configure_phase_timer,
+    get_phase_timer,
+    session_summary_html,
+)
+from utils.tracing import configure_command_tracer, get_command_tracer
+
+try:
+    from pytest_metadata.plugin import metadata_key
+except ImportError:  # pytest-metadata no instalado
+    metadata_key = None
+
+try:
+    from pytest_html import extras as html_extras
+except ImportError:  # pytest-html no instalado
+    html_extras = None
+
 # Configuración de rutas
 BASE_DIR = Path(__file__).resolve().parent.parent
 APP_DIR = BASE_DIR / "app"
 REPORTS_DIR = BASE_DIR / "reports"
-SCREENSHOTS_DIR = REPORTS_DIR / "screenshots"
 
-# Crear directorios
-SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+# Reporte que muestra pytest-html por prueba ("call", o "setup" si no pasó),
+# pendiente de recibir el desglose por fases que llega con el del teardown
+_displayed_reports = {}
 
 
-@pytest.fixture(scope="function")
-def driver():
-    """Fixture del driver de Chrome"""
-    options = Options()
-    options.add_argument("--start-maximized")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    
-    # Intentar encontrar Chrome
-    chrome_paths = [
-        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+def pytest_addoption(parser):
+    """Opciones de línea de comandos del proyecto"""
+    parser.addoption(
+        "--browser-pool-size",
+        action="store",
+        type=int,
+        default=1,
+        help="Número de navegadores Chrome que se mantienen abiertos durante la sesión",
+    )
+    parser.addoption(
+        "--browser-profile",
+        action="store",
+        default=None,
+        choices=sorted(PROFILES),
+        help=f"Perfil de lanzamiento de Chrome (también vía {PROFILE_ENV_VAR}). "
+             f"Por defecto: {DEFAULT_PROFILE}",
+    )
+    parser.addoption(
+        "--screenshots",
+        action="store",
+        default="always",
+        choices=CapturePolicy.MODES,
+        help="Cuándo guardar capturas: always, on-failure (solo si la prueba falla) o never",
+    )
+    parser.addoption(
+        "--screenshot-buffer",
+        action="store",
+        type=int,
+        default=5,
+        help="Capturas recientes que se conservan en memoria en modo on-failure",
+    )
+    parser.addoption(
+        "--no-command-trace",
+        action="store_true",
+        default=False,
+        help="No registrar los comandos WebDriver de cada prueba en el reporte HTML",
+    )
+    parser.addoption(
+        "--phase-trace",
+        action="store",
+        default=None,
+        metavar="RUTA",
+        help="Exporta el tiempo por fase de cada prueba como Chrome Trace JSON "
+             "(con pytest-xdist, un solo archivo con una fila por proceso)",
+    )
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Ejecuta los benchmarks y las pruebas de tiempos (marcadores "
+             "benchmark y timing), omitidos por defecto",
+    )
+    parser.addoption(
+        "--benchmark-json",
+        action="store",
+        default=str(DEFAULT_RESULTS_PATH),
+        metavar="RUTA",
+        help="Archivo JSON donde se escriben los resultados de los benchmarks",
+    )
+    parser.addoption(
+        "--benchmark-baseline",
+        action="store",
+        default=None,
+        metavar="RUTA",
+        help="JSON de una ejecución anterior; los benchmarks fallan si empeoran más que el umbral",
+    )
+    parser.addoption(
+        "--benchmark-threshold",
+        action="store",
+        type=float,
+        default=0.25,
+        help="Empeoramiento relativo de la mediana que cuenta como regresión (0.25 = 25 %%)",
+    )
+
+
+def pytest_configure(config):
+    """Resuelve el perfil de Chrome y lo registra en los metadatos del reporte"""
+    try:
+        config.browser_profile = resolve_profile_name(config.getoption("--browser-profile"))
+    except ValueError as error:
+        raise pytest.UsageError(str(error))
+    
+    configure_capture_policy(
+        config.getoption("--screenshots"),
+        config.getoption("--screenshot-buffer"),
+    )
+    configure_command_tracer(not config.getoption("--no-command-trace"))
+    configure_phase_timer(trace=bool(config.getoption("--phase-trace")))
+    
+    baseline = config.getoption("--benchmark-baseline")
+    if baseline and not Path(baseline).is_file():
+        raise pytest.UsageError(f"No existe la línea base de benchmarks: {baseline}")
+    configure_benchmark_recorder(baseline, config.getoption("--benchmark-threshold"))
+    
+    if metadata_key is not None and metadata_key in config.stash:
+        config.stash[metadata_key]["Perfil de navegador"] = config.browser_profile
+
+
+def pytest_collection_modifyitems(config, items):
+    """Omite los benchmarks y las pruebas de tiempos salvo que se pida --run-benchmarks"""
+    if config.getoption("--run-benchmarks"):
+        return
+    
+    skip = pytest.mark.skip(reason="Mide tiempos: ejecutar con --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords or "timing" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_runtest_setup(item):
+    """Empieza cada prueba sin capturas pendientes en memoria ni comandos registrados"""
+    get_capture_policy().start_test(item.nodeid)
+    get_command_tracer().start_test()
+    get_phase_timer().start_test(item.nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Mide el cuerpo de la prueba"""
+    with get_phase_timer().phase("body"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Guarda las capturas recientes solo si la prueba falló y las enlaza en el reporte"""
+    outcome = yield
+    report = outcome.get_result()
+    
+    if report.when == "teardown":
+        # Viaja con el reporte (pytest-xdist lo serializa) hasta el proceso
+        # que escribe el HTML; ver pytest_runtest_logreport
+        report.phase_breakdown = get_phase_timer().finish_test()
+        return
+    
+    if report.when != "call" and not (report.when == "setup" and report.failed):
+        return
+    
+    policy = get_capture_policy()
+    if not report.failed:
+        policy.discard_buffer()
+    else:
+        with get_phase_timer().phase("screenshot"):
+            # Captura del estado final de la página al fallar
+            driver = item.funcargs.get("driver")
+            if driver is not None:
+                try:
+                    policy.capture(driver, f"{item.name}_fallo")
+                except Exception:
+                    pass  # El navegador puede haber fallado junto con la prueba
+            policy.persist_buffer()
+    
+    _link_screenshots(item.config, report, policy.saved)
+    _attach_command_trace(item.config, report)
+
+
+def _link_screenshots(config, report, saved):
+    """Agrega al reporte HTML un enlace a cada captura guardada en la prueba"""
+    html_path = getattr(config.option, "htmlpath", None)
+    if html_extras is None or not html_path or not saved:
+        return
+    
+    report_dir = Path(html_path).resolve().parent
+    links = [
+        html_extras.url(Path(os.path.relpath(path, report_dir)).as_posix(), name=step)
+        for step, path in saved
     ]
+    report.extras = getattr(report, "extras", []) + links
+
+
+def _attach_command_trace(config, report):
+    """Agrega al reporte HTML el resumen de comandos WebDriver de la prueba"""
+    if html_extras is None or not getattr(config.option, "htmlpath", None):
+        return
+    
+    trace_html = get_command_tracer().summary_html()
+    if trace_html:
+        report.extras = getattr(report, "extras", []) + [html_extras.html(trace_html)]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_logreport(report):
+    """
+    Agrega el desglose por fases al reporte que muestra pytest-html
     
-    for path in chrome_paths:
-        if os.path.exists(path):
-            options.binary_location = path
-            break
+    El desglose se conoce al terminar el teardown, cuando el reporte de
+    "call" ya se generó (y, con pytest-xdist, ya se envió al proceso
+    principal). Este hook corre en el proceso que escribe el HTML, antes
+    de que pytest-html procese los reportes de la prueba al recibir el del
+    teardown; pytest-html omite los extras de un teardown que pasó, así que
+    la tabla se mueve al reporte de "call" o al del setup si no pasó.
+    """
+    if report.when == "call" or (report.when == "setup" and report.outcome != "passed"):
+        _displayed_reports[report.nodeid] = report
+        return
+    if report.when != "teardown":
+        return
+    
+    target = _displayed_reports.pop(report.nodeid, None)
+    table = breakdown_html(getattr(report, "phase_breakdown", None) or {})
+    if html_extras is None or target is None or not table:
+        return
+    target.extras = getattr(target, "extras", []) + [html_extras.html(table)]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    """Agrega al resumen del reporte HTML el tiempo acumulado por fase"""
+    table = session_summary_html(get_phase_timer())
+    if table:
+        postfix.append(table)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Muestra el tiempo acumulado por fase al final de la ejecución"""
+    timer = get_phase_timer()
+    if not timer.tests:
+        return
+    
+    terminalreporter.section(f"Tiempo por fase ({timer.tests} pruebas)")
+    for row in timer.session_summary():
+        terminalreporter.write_line(
+            f"{row['label']:<34} {row['total_s']:>8.2f} s  "
+            f"{row['mean_ms']:>7.0f} ms/prueba  {row['share']:>4.0%}"
+        )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Espera a que se terminen de escribir las capturas y guarda el índice,
+    la traza por fases y los resultados de los benchmarks
+    """
+    with get_phase_timer().phase("screenshot"):
+        get_screenshot_writer().shutdown()
+    get_screenshot_store().save_index(get_worker_id())
+    
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        # Proceso de pytest-xdist: el principal combina las mediciones
+        workeroutput["phase_timer"] = get_phase_timer().export()
+        workeroutput["benchmarks"] = get_benchmark_recorder().results
+        return
+    
+    trace_path = session.config.getoption("--phase-trace")
+    if trace_path:
+        get_phase_timer().write_chrome_trace(trace_path)
+    get_benchmark_recorder().save(session.config.getoption("--benchmark-json"))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Combina las mediciones de un proceso de pytest-xdist al terminar"""
+    workeroutput = getattr(node, "workeroutput", {})
+    if workeroutput.get("phase_timer"):
+        get_phase_timer().merge(workeroutput["phase_timer"])
+    get_benchmark_recorder().merge(workeroutput.get("benchmarks", {}))
+
+
+def get_worker_id():
+    """
+    Identificador del proceso de pytest-xdist ("master" si se ejecuta en serie)
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def create_driver(profile_name=DEFAULT_PROFILE, profile_dir=None):
+    """
+    Crea una instancia nueva del driver de Chrome
+    
+    Args:
+        profile_name: Perfil de lanzamiento (headed, headless o minimal)
+        profile_dir: Directorio de perfil (user-data-dir) propio de la instancia.
+            Cada perfil tiene su propio localStorage/sessionStorage, así los
+            procesos en paralelo no comparten "records" ni "isAuthenticated".
+    """
+    options = build_chrome_options(profile_name, profile_dir)
     
     # Crear driver
     driver = webdriver.Chrome(options=options)
-    driver.implicitly_wait(10)
+    # Sin espera implícita: las esperas explícitas de BasePage no se suman
+    # a ella y las comprobaciones de ausencia responden de inmediato
+    driver.implicitly_wait(0)
+    return driver
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request, tmp_path_factory):
+    """Pool de navegadores reutilizados durante toda la sesión (uno por proceso)"""
+    worker_id = get_worker_id()
+    
+    profile_name = request.config.browser_profile
+    
+    def factory():
+        # tmp_path_factory ya es independiente por proceso de xdist
+        return create_driver(profile_name, tmp_path_factory.mktemp(f"chrome-profile-{worker_id}"))
+    
+    pool = BrowserPool(factory, size=request.config.getoption("--browser-pool-size"))
+    with get_phase_timer().phase("driver"):
+        pool.warm()
+    
+    yield pool
+    
+    with get_phase_timer().phase("teardown"):
+        pool.shutdown()
+
+
+@pytest.fixture(scope="function")
+def driver(browser_pool):
+    """Fixture del driver de Chrome, tomado del pool y restablecido al terminar"""
+    # Registra cada comando WebDriver (nombre, localizador, duración y llamador)
+    with get_phase_timer().phase("driver"):
+        driver = get_command_tracer().install(browser_pool.acquire())
     
     yield driver
     
-    # Cleanup
-    try:
-        driver.quit()
-    except:
-        pass
+    # Cleanup: limpia almacenamiento, cookies y alertas y vuelve a about:blank
+    with get_phase_timer().phase("teardown"):
+        browser_pool.release(driver)
 
 
 @pytest.fixture(scope="function")
@@ -61,24 +386,42 @@ def base_url():
 
 @pytest.fixture(scope="function")
 def clean_session(driver):
-    """Limpiar sessionStorage antes y después de cada prueba"""
+    """Limpiar sessionStorage, localStorage e IndexedDB después de cada prueba"""
     # No limpiar al inicio - el test navegará primero
     yield
     # Limpiar al final si la página está cargada
     try:
-        driver.execute_script("sessionStorage.clear();")
-        driver.execute_script("localStorage.clear();")
+        # Espera las escrituras pendientes de la app antes de limpiar
+        with get_phase_timer().phase("teardown"):
+            driver.execute_async_script(CLEAR_STORAGE_SCRIPT)
     except:
         pass  # Ignorar si no hay página cargada
 
+@pytest.fixture(scope="function")
+def authenticated_crud_page(driver, base_url, clean_session):
+    """
+    Fixture que proporciona una página CRUD autenticada
+    
+    Escribe la sesión en sessionStorage en lugar de usar el formulario de
+    login (cubierto por test_login.py) y carga index.html directamente.
+    """
+    with get_phase_timer().phase("auth"):
+        login_page = LoginPage(driver, base_url)
+        login_page.navigate()
+        login_page.inject_session("admin")
+        
+        crud_page = CRUDPage(driver, base_url)
+        crud_page.navigate()
+    
+    return crud_page
+
+
 @pytest.fixture(scope="function")
 def take_screenshot(driver, request):
     """Fixture para tomar capturas de pantalla"""
     def _screenshot(name):
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_name = f"{name}_{timestamp}.png"
-        screenshot_path = SCREENSHOTS_DIR / screenshot_name
-        driver.save_screenshot(str(screenshot_path))
-        return str(screenshot_path)
+        # Solo se captura aquí; el PNG se escribe en segundo plano en
+        # reports/screenshots/objects y la prueba y el paso quedan en index.json
+        return capture_screenshot(driver, name)
     
     return _screenshot
@@ -2,28 +2,145 @@
 base_page.py - Clase base para Page Object Model
 """
 
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from datetime import datetime
-from pathlib import Path
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    NoAlertPresentException,
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+)
+
+from utils.screenshots import capture_screenshot
+
+
+# Observa cualquier cambio dentro del elemento y lo marca como mutado
+ARM_MUTATION_WATCH_SCRIPT = """
+const el = arguments[0];
+if (el.__readinessObserver) { el.__readinessObserver.disconnect(); }
+el.__mutated = false;
+el.__readinessObserver = new MutationObserver(() => { el.__mutated = true; });
+el.__readinessObserver.observe(el, {
+    attributes: true, childList: true, subtree: true, characterData: true
+});
+"""
+
+# Devuelve true (y deja de observar) si el elemento cambió desde que se armó
+CONSUME_MUTATION_WATCH_SCRIPT = """
+const el = arguments[0];
+if (!el.__mutated) { return false; }
+if (el.__readinessObserver) { el.__readinessObserver.disconnect(); }
+el.__readinessObserver = null;
+return true;
+"""
+
+# Espera a que la app guarde sus cambios pendientes y luego limpia localStorage
+CLEAR_LOCAL_STORAGE_SCRIPT = """
+const done = arguments[arguments.length - 1];
+(async () => {
+    if (window.recordManager) {
+        try { await window.recordManager.flushRecords(); } catch (e) {}
+    }
+    localStorage.clear();
+})().then(() => done(true), () => done(false));
+"""
+
+# Estado de la página y de un localizador en un solo viaje al navegador.
+# La página está asentada si terminó de cargar, la app cargó sus registros
+# (data-storage), no hay una redirección programada (data-redirect-ready) y
+# no hay animaciones en curso. present/visible son null si la estrategia del
+# localizador no se puede resolver aquí.
+PROBE_SCRIPT = """
+const using = arguments[0];
+const value = arguments[1];
+const root = document.documentElement;
+
+const find = () => {
+    switch (using) {
+        case 'id': {
+            const el = document.getElementById(value);
+            return el ? [el] : [];
+        }
+        case 'css selector': return Array.from(document.querySelectorAll(value));
+        case 'class name': return Array.from(document.getElementsByClassName(value));
+        case 'tag name': return Array.from(document.getElementsByTagName(value));
+        case 'name': return Array.from(document.getElementsByName(value));
+        case 'xpath': {
+            const result = document.evaluate(
+                value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+            );
+            return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+        }
+        default: return null;
+    }
+};
+const isVisible = el => el.checkVisibility
+    ? el.checkVisibility({opacityProperty: true, visibilityProperty: true})
+    : el.getClientRects().length > 0;
+
+const settled = document.readyState === 'complete'
+    && (!window.recordManager || root.hasAttribute('data-storage'))
+    && !root.hasAttribute('data-redirect-ready')
+    && (!document.getAnimations
+        || document.getAnimations().every(a => a.playState !== 'running'));
+
+const elements = find();
+return {
+    settled: settled,
+    present: elements && elements.length > 0,
+    visible: elements && elements.some(isVisible)
+};
+"""
+
+# Devuelve true cuando el elemento y sus descendientes no tienen animaciones activas
+ANIMATIONS_FINISHED_SCRIPT = """
+const el = arguments[0];
+if (!el.getAnimations) { return true; }
+return el.getAnimations({subtree: true}).every(a => a.playState !== 'running');
+"""
 
 
 class BasePage:
     """
     Clase base que contiene métodos comunes para todos los Page Objects
+    
+    Caché de elementos: click_element, send_keys, get_text y las esperas
+    de clases y mutaciones reutilizan los elementos ya localizados por ID;
+    los demás localizadores se buscan siempre. No hay comprobación de
+    generación del DOM: validarla costaría el mismo viaje al navegador que
+    buscar el elemento. El elemento guardado solo se descarta cuando usarlo
+    produce StaleElementReferenceException (se eliminó del documento o la
+    página navegó), al navegar o refrescar con los Page Objects, o con
+    invalidate_element_cache().
+    
+    Límites: si la app cambia el contenido del nodo, la lectura ve el
+    contenido nuevo, porque el nodo es el mismo. Pero si la app asigna el
+    ID a otro nodo sin quitar el anterior del documento, o vuelve a
+    insertar un nodo que había quitado, se sigue usando el nodo guardado
+    sin verificarlo. En esos casos hay que llamar a
+    invalidate_element_cache(locator) después del cambio.
     """
     
+    # Intervalo de sondeo de las esperas (segundos)
+    POLL_FREQUENCY = 0.05
+    
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
-        self.screenshots_dir = Path(__file__).resolve().parent.parent.parent / "reports" / "screenshots"
-        self.screenshots_dir.mkdir(parents=True, exist_ok=True)
+        self.wait = WebDriverWait(driver, 10, poll_frequency=self.POLL_FREQUENCY)
+        # Elementos ya localizados por ID: localizador -> WebElement
+        self._element_cache = {}
     
     def find_element(self, locator, timeout=10):
         """
         Encuentra un elemento con espera explícita
         
+        Siempre localiza el elemento (quien lo recibe puede usarlo después
+        de una navegación) y lo guarda para los métodos de BasePage que
+        reutilizan elementos y lo vuelven a buscar si quedó obsoleto.
+        
         Args:
             locator: Tupla (By.ID, "id_value")
             timeout: Tiempo máximo de espera en segundos
@@ -32,16 +149,20 @@ class BasePage:
             WebElement encontrado
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             element = wait.until(EC.presence_of_element_located(locator))
-            return element
         except TimeoutException:
             raise TimeoutException(f"No se pudo encontrar el elemento: {locator}")
+        self._cache_element(locator, element)
+        return element
     
     def find_elements(self, locator, timeout=10):
         """
         Encuentra múltiples elementos con espera explícita
         
+        Si la página está asentada y no hay elementos, retorna la lista
+        vacía sin esperar el timeout.
+        
         Args:
             locator: Tupla (By.CLASS_NAME, "class_value")
             timeout: Tiempo máximo de espera en segundos
@@ -49,12 +170,9 @@ class BasePage:
         Returns:
             Lista de WebElements encontrados
         """
-        try:
-            wait = WebDriverWait(self.driver, timeout)
-            wait.until(EC.presence_of_element_located(locator))
-            return self.driver.find_elements(*locator)
-        except TimeoutException:
+        if not self._wait_for_state(locator, "present", timeout):
             return []
+        return self.driver.find_elements(*locator)
     
     def click_element(self, locator, timeout=10):
         """
@@ -64,12 +182,26 @@ class BasePage:
             locator: Tupla (By.ID, "id_value")
             timeout: Tiempo máximo de espera en segundos
         """
+        # Con el elemento en caché basta verificar que esté habilitado; si no
+        # se puede hacer clic todavía, se espera como con uno nuevo
+        element = self._cached_element(locator)
+        if element is not None:
+            try:
+                if element.is_enabled():
+                    element.click()
+                    return
+            except StaleElementReferenceException:
+                self.invalidate_element_cache(locator)
+            except (ElementClickInterceptedException, ElementNotInteractableException):
+                pass
+        
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             element = wait.until(EC.element_to_be_clickable(locator))
             element.click()
         except TimeoutException:
             raise TimeoutException(f"El elemento no es clickeable: {locator}")
+        self._cache_element(locator, element)
     
     def send_keys(self, locator, text, clear_first=True, timeout=10):
         """
@@ -81,10 +213,12 @@ class BasePage:
             clear_first: Si debe limpiar el campo primero
             timeout: Tiempo máximo de espera
         """
-        element = self.find_element(locator, timeout)
-        if clear_first:
-            element.clear()
-        element.send_keys(text)
+        def _type(element):
+            if clear_first:
+                element.clear()
+            element.send_keys(text)
+        
+        self._with_element(locator, _type, timeout)
     
     def get_text(self, locator, timeout=10):
         """
@@ -97,13 +231,101 @@ class BasePage:
         Returns:
             Texto del elemento
         """
-        element = self.find_element(locator, timeout)
-        return element.text
+        return self._with_element(locator, lambda element: element.text, timeout)
+    
+    # ===== Caché de elementos =====
+    
+    def _cached_element(self, locator):
+        """
+        Obtiene un elemento ya localizado si sigue siendo válido
+        
+        Solo se guardan elementos localizados por ID: siguen siendo los
+        mismos mientras estén en el documento y, si se eliminan o la página
+        navega, usarlos produce StaleElementReferenceException y se vuelven
+        a buscar. Con otros localizadores el elemento que coincide puede
+        cambiar sin que el anterior se elimine, y comprobarlo costaría el
+        mismo viaje que buscarlo de nuevo.
+        
+        Args:
+            locator: Tupla (By.ID, "id_value")
+            
+        Returns:
+            WebElement o None
+        """
+        return self._element_cache.get(locator)
+    
+    def _cache_element(self, locator, element):
+        """
+        Guarda un elemento localizado (solo localizadores por ID)
+        
+        Args:
+            locator: Tupla (By.ID, "id_value")
+            element: WebElement encontrado
+        """
+        if locator[0] == By.ID:
+            self._element_cache[locator] = element
+    
+    def invalidate_element_cache(self, locator=None):
+        """
+        Descarta los elementos guardados
+        
+        Args:
+            locator: Localizador a descartar; None descarta todos
+        """
+        if locator is None:
+            self._element_cache.clear()
+        else:
+            self._element_cache.pop(locator, None)
+    
+    def _with_element(self, locator, action, timeout=10):
+        """
+        Ejecuta una acción sobre el elemento, volviendo a buscarlo una vez
+        si el guardado ya no está en el documento
+        
+        Args:
+            locator: Tupla (By.ID, "id_value")
+            action: Función que recibe el WebElement
+            timeout: Tiempo máximo de espera para encontrarlo; None lo busca
+                sin esperar (para usar dentro de otra espera)
+            
+        Returns:
+            Resultado de la acción
+        """
+        try:
+            return action(self._locate(locator, timeout))
+        except StaleElementReferenceException:
+            self.invalidate_element_cache(locator)
+            return action(self._locate(locator, timeout))
+    
+    def _locate(self, locator, timeout):
+        """
+        Obtiene el elemento de la caché o lo busca
+        
+        Args:
+            locator: Tupla (By.ID, "id_value")
+            timeout: Tiempo máximo de espera; None busca una sola vez
+                (NoSuchElementException si no existe)
+            
+        Returns:
+            WebElement
+        """
+        element = self._cached_element(locator)
+        if element is not None:
+            return element
+        if timeout is not None:
+            return self.find_element(locator, timeout)
+        
+        element = self.driver.find_element(*locator)
+        self._cache_element(locator, element)
+        return element
     
     def is_element_visible(self, locator, timeout=5):
         """
         Verifica si un elemento es visible
         
+        Con la página asentada responde con una sola consulta; si no, espera
+        a que el elemento sea visible o a que la página se asiente.
+        
         Args:
             locator: Tupla (By.ID, "id_value")
             timeout: Tiempo máximo de espera
@@ -111,17 +333,15 @@ class BasePage:
         Returns:
             True si el elemento es visible, False en caso contrario
         """
-        try:
-            wait = WebDriverWait(self.driver, timeout)
-            wait.until(EC.visibility_of_element_located(locator))
-            return True
-        except TimeoutException:
-            return False
+        return self._wait_for_state(locator, "visible", timeout)
     
     def is_element_present(self, locator, timeout=5):
         """
         Verifica si un elemento está presente en el DOM
         
+        Con la página asentada responde con una sola consulta; si no, espera
+        a que el elemento aparezca o a que la página se asiente.
+        
         Args:
             locator: Tupla (By.ID, "id_value")
             timeout: Tiempo máximo de espera
@@ -129,12 +349,7 @@ class BasePage:
         Returns:
             True si el elemento está presente, False en caso contrario
         """
-        try:
-            wait = WebDriverWait(self.driver, timeout)
-            wait.until(EC.presence_of_element_located(locator))
-            return True
-        except TimeoutException:
-            return False
+        return self._wait_for_state(locator, "present", timeout)
     
     def wait_for_url_to_be(self, url, timeout=10):
         """
@@ -148,7 +363,7 @@ class BasePage:
             True si la URL coincide, False en caso contrario
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             wait.until(EC.url_to_be(url))
             return True
         except TimeoutException:
@@ -166,12 +381,237 @@ class BasePage:
             True si la URL contiene el texto, False en caso contrario
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             wait.until(EC.url_contains(url_part))
             return True
         except TimeoutException:
             return False
     
+    # ===== Esperas de disponibilidad =====
+    
+    def _wait(self, timeout):
+        """
+        Crea una espera explícita con sondeo rápido
+        
+        Args:
+            timeout: Tiempo máximo de espera en segundos
+            
+        Returns:
+            WebDriverWait configurado
+        """
+        return WebDriverWait(
+            self.driver,
+            timeout,
+            poll_frequency=self.POLL_FREQUENCY,
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException),
+        )
+    
+    def probe(self, locator):
+        """
+        Consulta en un solo viaje si la página está asentada y si el
+        localizador tiene elementos presentes y visibles
+        
+        Args:
+            locator: Tupla (By.ID, "id_value")
+            
+        Returns:
+            Diccionario {"settled": bool, "present": bool, "visible": bool}
+        """
+        state = self.execute_script(PROBE_SCRIPT, *locator)
+        if state["present"] is None:
+            # Estrategia no resoluble en JavaScript (p. ej. link text)
+            elements = self.driver.find_elements(*locator)
+            state["present"] = bool(elements)
+            state["visible"] = any(element.is_displayed() for element in elements)
+        return state
+    
+    def is_page_settled(self):
+        """
+        Verifica si la página terminó de cargar, sin animaciones ni
+        redirecciones pendientes
+        
+        Returns:
+            True si la página está asentada
+        """
+        return self.probe((By.ID, ""))["settled"]
+    
+    def wait_until_settled(self, timeout=10):
+        """
+        Espera a que la página se asiente (ver is_page_settled)
+        
+        Args:
+            timeout: Tiempo máximo de espera
+        """
+        try:
+            self._wait(timeout).until(lambda d: self.is_page_settled())
+        except TimeoutException:
+            raise TimeoutException("La página no se asentó")
+        return self
+    
+    def _wait_for_state(self, locator, state, timeout):
+        """
+        Espera a que un localizador cumpla un estado (present o visible)
+        
+        Retorna en cuanto se cumple, o con False en cuanto la página está
+        asentada sin cumplirlo: no hay nada pendiente que pueda cambiarlo.
+        
+        Args:
+            locator: Tupla (By.ID, "id_value")
+            state: "present" o "visible"
+            timeout: Tiempo máximo de espera
+            
+        Returns:
+            True si el localizador cumple el estado
+        """
+        def _answered(driver):
+            result = self.probe(locator)
+            if result[state] or result["settled"]:
+                return result
+            return False
+        
+        try:
+            return bool(self._wait(timeout).until(_answered)[state])
+        except TimeoutException:
+            return False
+    
+    def has_class(self, locator, css_class):
+        """
+        Verifica si un elemento tiene una clase CSS
+        
+        Args:
+            locator: Tupla (By.ID, "id_value")
+            css_class: Clase CSS a verificar
+            
+        Returns:
+            True si el elemento tiene la clase
+        """
+        classes = self._with_element(
+            locator, lambda element: element.get_attribute("class"), timeout=None
+        ) or ""
+        return css_class in classes.split()
+    
+    def wait_for_class(self, locator, css_class, timeout=10):
+        """
+        Espera a que un elemento tenga una clase CSS
+        
+        Args:
+            locator: Tupla (By.ID, "id_value")
+            css_class: Clase CSS esperada
+            timeout: Tiempo máximo de espera
+        """
+        try:
+            self._wait(timeout).until(lambda d: self.has_class(locator, css_class))
+        except TimeoutException:
+            raise TimeoutException(f"El elemento {locator} no obtuvo la clase '{css_class}'")
+    
+    def wait_for_class_removed(self, locator, css_class, timeout=10):
+        """
+        Espera a que un elemento pierda una clase CSS
+        
+        Args:
+            locator: Tupla (By.ID, "id_value")
+            css_class: Clase CSS que debe desaparecer
+            timeout: Tiempo máximo de espera
+        """
+        try:
+            self._wait(timeout).until(lambda d: not self.has_class(locator, css_class))
+        except TimeoutException:
+            raise TimeoutException(f"El elemento {locator} mantiene la clase '{css_class}'")
+    
+    def wait_for_animations(self, locator, timeout=10):
+        """
+        Espera a que terminen las animaciones CSS de un elemento y sus hijos
+        
+        Args:
+            locator: Tupla (By.ID, "id_value")
+            timeout: Tiempo máximo de espera
+        """
+        self._locate(locator, timeout)
+        try:
+            self._wait(timeout).until(lambda d: self._with_element(
+                locator,
+                lambda element: d.execute_script(ANIMATIONS_FINISHED_SCRIPT, element),
+                timeout=None,
+            ))
+        except TimeoutException:
+            raise TimeoutException(f"Las animaciones de {locator} no terminaron")
+    
+    def watch_mutations(self, locator):
+        """
+        Empieza a observar cambios en un elemento (atributos, hijos o texto)
+        
+        Debe llamarse antes de la acción que provoca el cambio; luego
+        wait_for_mutation() retorna en cuanto el cambio ocurre.
+        
+        Args:
+            locator: Tupla (By.ID, "id_value")
+        """
+        self._with_element(
+            locator, lambda element: self.execute_script(ARM_MUTATION_WATCH_SCRIPT, element)
+        )
+    
+    def has_mutated(self, locator):
+        """
+        Verifica si un elemento observado cambió
+        
+        Args:
+            locator: Tupla (By.ID, "id_value")
+            
+        Returns:
+            True si hubo cambios desde watch_mutations()
+        """
+        return self._with_element(
+            locator,
+            lambda element: self.execute_script(CONSUME_MUTATION_WATCH_SCRIPT, element),
+            timeout=None,
+        )
+    
+    def wait_for_mutation(self, locator, timeout=10):
+        """
+        Espera a que un elemento observado con watch_mutations() cambie
+        
+        Args:
+            locator: Tupla (By.ID, "id_value")
+            timeout: Tiempo máximo de espera
+        """
+        try:
+            self._wait(timeout).until(lambda d: self.has_mutated(locator))
+        except TimeoutException:
+            raise TimeoutException(f"El elemento {locator} no cambió")
+    
+    def is_js_alert_present(self):
+        """
+        Verifica si hay un diálogo de JavaScript (alert/confirm) abierto
+        
+        Returns:
+            True si hay un diálogo abierto
+        """
+        try:
+            self.driver.switch_to.alert
+            return True
+        except NoAlertPresentException:
+            return False
+    
+    def wait_for_any_mutation(self, locators, timeout=10):
+        """
+        Espera a que cambie cualquiera de los elementos observados o a que
+        aparezca un diálogo de JavaScript
+        
+        Args:
+            locators: Lista de tuplas observadas con watch_mutations()
+            timeout: Tiempo máximo de espera
+        """
+        def _condition(driver):
+            # Con un diálogo abierto no se puede ejecutar JavaScript
+            if self.is_js_alert_present():
+                return True
+            return any(self.has_mutated(locator) for locator in locators)
+        
+        try:
+            self._wait(timeout).until(_condition)
+        except TimeoutException:
+            raise TimeoutException(f"Ninguno de los elementos cambió: {locators}")
+    
     def get_current_url(self):
         """
         Obtiene la URL actual
@@ -189,13 +629,10 @@ class BasePage:
             name: Nombre descriptivo para la captura
             
         Returns:
-            Ruta del archivo de captura
+            Ruta del archivo de captura (None si la política no la guarda)
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_name = f"{name}_{timestamp}.png"
-        screenshot_path = self.screenshots_dir / screenshot_name
-        self.driver.save_screenshot(str(screenshot_path))
-        return str(screenshot_path)
+        # La escritura del PNG ocurre en segundo plano
+        return capture_screenshot(self.driver, name)
     
     def execute_script(self, script, *args):
         """
@@ -219,13 +656,17 @@ class BasePage:
     def clear_local_storage(self):
         """
         Limpia el localStorage del navegador
+        
+        Primero espera a que la app guarde sus cambios pendientes; si no,
+        esa escritura terminaría después de limpiar y los volvería a escribir.
         """
-        self.execute_script("localStorage.clear();")
+        self.driver.execute_async_script(CLEAR_LOCAL_STORAGE_SCRIPT)
     
     def refresh_page(self):
         """
         Recarga la página actual
         """
+        self.invalidate_element_cache()
         self.driver.refresh()
     
     def get_alert_text(self):
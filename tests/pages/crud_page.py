@@ -2,9 +2,84 @@
 crud_page.py - Page Object para la página principal del CRUD
 """
 
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import Select
 from pages.base_page import BasePage
-import time
+from pages.record_table import READ_TABLE_SCRIPT, SCROLL_TO_RECORD_SCRIPT, TableSnapshot
+
+
+# Los scripts de datos pasan por el almacenamiento de la app
+# (RecordManager.storage), así funcionan igual con IndexedDB y con
+# localStorage. Son asíncronos: terminan llamando al callback de
+# execute_async_script con el resultado o con {error}.
+
+# Espera a que la app cargue sus registros y renderice la tabla
+WAIT_FOR_READY_SCRIPT = """
+const done = arguments[arguments.length - 1];
+if (!window.recordManager) {
+    done(null);
+    return;
+}
+window.recordManager.ready.then(done, error => done({error: String(error)}));
+"""
+
+# Guarda registros con el esquema de RecordManager. Los IDs son marcas de
+# tiempo consecutivas anteriores a "ahora", así nunca chocan con los que la
+# app genere después con Date.now(). Antes guarda los cambios pendientes de
+# la app para no leerlos desactualizados ni perderlos.
+SEED_RECORDS_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const incoming = arguments[0];
+const append = arguments[1];
+const manager = window.recordManager;
+
+(async () => {
+    await manager.ready;
+    await manager.flushRecords();
+    const existing = append ? await manager.storage.loadAll() : [];
+    const oldest = existing.reduce((min, r) => Math.min(min, Number(r.id)), Date.now());
+    const base = oldest - incoming.length;
+    const createdAt = new Date().toISOString();
+    const seeded = incoming.map((r, i) => ({
+        id: String(base + i),
+        name: r.name,
+        description: r.description || '',
+        category: r.category || '',
+        date: r.date || '',
+        createdAt: createdAt
+    }));
+    await manager.storage.replaceAll(existing.concat(seeded));
+    return seeded;
+})().then(done, error => done({error: String(error)}));
+"""
+
+# Lee los registros guardados después de esperar las escrituras pendientes
+SNAPSHOT_RECORDS_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const manager = window.recordManager;
+
+(async () => {
+    await manager.ready;
+    await manager.flushRecords();
+    return manager.storage.loadAll();
+})().then(done, error => done({error: String(error)}));
+"""
+
+# Espera a que la app guarde sus cambios pendientes (guardado por lotes);
+# si la escritura falla retorna el error
+WAIT_FOR_PERSISTED_SCRIPT = """
+const done = arguments[arguments.length - 1];
+if (!window.recordManager) {
+    done(null);
+    return;
+}
+window.recordManager.whenPersisted().then(done, error => done({error: String(error)}));
+"""
+
+QUERY_RECORDS_SCRIPT = "return window.queryRecords(arguments[0]);"
+
+GOTO_PAGE_SCRIPT = "return window.recordManager.goToPage(arguments[0]);"
 
 
 class CRUDPage(BasePage):
@@ -28,8 +103,19 @@ class CRUDPage(BasePage):
     EMPTY_STATE = (By.ID, "empty-state")
     TOTAL_COUNT = (By.ID, "total-count")
     
+    # Localizadores - Búsqueda
+    SEARCH_INPUT = (By.ID, "search-input")
+    VISIBLE_COUNT = (By.ID, "visible-count")
+    
+    # Localizadores - Paginación
+    PAGE_SIZE_SELECT = (By.ID, "page-size")
+    PREV_PAGE_BUTTON = (By.ID, "btn-prev-page")
+    NEXT_PAGE_BUTTON = (By.ID, "btn-next-page")
+    PAGE_INDICATOR = (By.ID, "page-indicator")
+    
     # Localizadores - Modal Crear/Editar
     RECORD_MODAL = (By.ID, "record-modal")
+    RECORD_FORM = (By.ID, "record-form")
     MODAL_TITLE = (By.ID, "modal-title")
     RECORD_NAME_INPUT = (By.ID, "record-name")
     RECORD_DESCRIPTION_INPUT = (By.ID, "record-description")
@@ -48,13 +134,57 @@ class CRUDPage(BasePage):
         self.base_url = base_url
         self.url = f"{base_url}/index.html"
     
-    def navigate(self):
+    def navigate(self, storage=None):
         """
-        Navega a la página principal del CRUD
+        Navega a la página principal del CRUD y espera a que carguen los registros
+        
+        Args:
+            storage: Almacenamiento a forzar ("localStorage"); por defecto
+                la app usa IndexedDB si está disponible
         """
-        self.driver.get(self.url)
+        url = f"{self.url}?storage={storage}" if storage else self.url
+        self.invalidate_element_cache()
+        self.driver.get(url)
+        self.wait_until_ready()
         return self
     
+    def refresh_page(self):
+        """
+        Recarga la página y espera a que carguen los registros
+        """
+        super().refresh_page()
+        self.wait_until_ready()
+    
+    def wait_until_ready(self):
+        """
+        Espera a que la app cargue sus registros (la carga es asíncrona)
+        
+        Returns:
+            Nombre del almacenamiento en uso, o None si la app no está cargada
+        """
+        return self._run_async_script(WAIT_FOR_READY_SCRIPT)
+    
+    def get_storage_backend(self):
+        """
+        Obtiene el almacenamiento que usa la app
+        
+        Returns:
+            "indexedDB" o "localStorage"
+        """
+        return self.driver.find_element(By.TAG_NAME, "html").get_attribute("data-storage")
+    
+    def _run_async_script(self, script, *args):
+        """
+        Ejecuta un script asíncrono de datos y propaga sus errores
+        
+        Returns:
+            Resultado del script
+        """
+        result = self.driver.execute_async_script(script, *args)
+        if isinstance(result, dict) and "error" in result:
+            raise RuntimeError(f"Error en el almacenamiento de la app: {result['error']}")
+        return result
+    
     # ===== Métodos de Autenticación =====
     
     def is_authenticated(self):
@@ -127,23 +257,89 @@ class CRUDPage(BasePage):
     
     def get_table_rows(self):
         """
-        Obtiene todas las filas de la tabla
+        Obtiene todas las filas de registros renderizadas en la tabla
+        
+        Los espaciadores de la tabla por ventanas no tienen data-id y no
+        se cuentan.
         
         Returns:
             Lista de elementos de fila
         """
-        rows = self.find_elements((By.CSS_SELECTOR, "#table-body tr"))
+        rows = self.find_elements((By.CSS_SELECTOR, "#table-body tr[data-id]"))
         return rows
     
+    def read_table(self):
+        """
+        Lee toda la tabla en una sola llamada a WebDriver
+        
+        Returns:
+            TableSnapshot con las filas indexadas por id, nombre y categoría
+        """
+        return TableSnapshot.from_script_result(self.execute_script(READ_TABLE_SCRIPT))
+    
     def get_table_row_count(self):
         """
-        Obtiene el número de filas en la tabla
+        Obtiene el número de filas renderizadas en la tabla
+        
+        Con la tabla por ventanas es menor que get_total_count().
         
         Returns:
             Número de filas
         """
-        rows = self.get_table_rows()
-        return len(rows)
+        return len(self.read_table())
+    
+    def find_record(self, name=None, record_id=None):
+        """
+        Busca los datos de una fila por nombre o ID sin obtener el elemento
+        
+        Si la tabla está por ventanas o paginada y la fila no está
+        renderizada, se desplaza hasta ella (cambiando de página si hace
+        falta) y vuelve a leer la tabla.
+        
+        Args:
+            name: Nombre del registro
+            record_id: ID del registro
+            
+        Returns:
+            TableRow si se encuentra, None en caso contrario
+        """
+        table = self.read_table()
+        row = table.find_by_id(record_id) if record_id is not None else table.find_by_name(name)
+        if row is not None or not table.is_partial:
+            return row
+        
+        found_id = self.scroll_to_record(record_id=record_id, name=name)
+        if found_id is None:
+            return None
+        return self.read_table().find_by_id(found_id)
+    
+    def scroll_to_record(self, record_id=None, name=None):
+        """
+        Desplaza la tabla hasta un registro para que su fila quede renderizada
+        
+        Args:
+            record_id: ID del registro
+            name: Nombre del registro (se usa si no se indica el ID)
+            
+        Returns:
+            ID del registro, o None si no existe o la búsqueda activa lo oculta
+        """
+        record_id = str(record_id) if record_id is not None else None
+        return self.execute_script(SCROLL_TO_RECORD_SCRIPT, record_id, name)
+    
+    def get_row_element(self, record_id):
+        """
+        Obtiene el elemento <tr> de un registro por su ID
+        
+        Args:
+            record_id: ID del registro
+            
+        Returns:
+            WebElement de la fila
+        """
+        return self.driver.find_element(
+            By.CSS_SELECTOR, f'#table-body tr[data-id="{record_id}"]'
+        )
     
     def get_record_by_name(self, name):
         """
@@ -155,12 +351,185 @@ class CRUDPage(BasePage):
         Returns:
             Elemento de fila si se encuentra, None en caso contrario
         """
-        rows = self.get_table_rows()
-        for row in rows:
-            cells = row.find_elements(By.TAG_NAME, "td")
-            if len(cells) > 1 and cells[1].text == name:
-                return row
-        return None
+        row = self.find_record(name=name)
+        if row is None:
+            return None
+        return self.get_row_element(row.record_id)
+    
+    def _click_row_action(self, name, button_class):
+        """
+        Hace clic en un botón de acción de la fila con el nombre dado
+        
+        Returns:
+            True si la fila existe y se hizo clic
+        """
+        row = self.find_record(name=name)
+        if row is None:
+            return False
+        button = self.driver.find_element(
+            By.CSS_SELECTOR, f'#table-body tr[data-id="{row.record_id}"] .{button_class}'
+        )
+        button.click()
+        return True
+    
+    # ===== Métodos de Búsqueda =====
+    
+    def search(self, term, timeout=10):
+        """
+        Escribe un término en el buscador y espera a que se filtre la tabla
+        
+        La app filtra cuando se deja de escribir; la espera termina cuando
+        el contador de resultados indica que ya aplicó el término.
+        
+        Args:
+            term: Texto a buscar (vacío para quitar el filtro)
+            timeout: Tiempo máximo de espera
+        """
+        self.send_keys(self.SEARCH_INPUT, term)
+        # Borrar el campo no siempre dispara 'input'; se asegura el aviso a la app
+        self.execute_script(
+            "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));",
+            self.find_element(self.SEARCH_INPUT),
+        )
+        expected = term.strip()
+        counter = self.find_element(self.VISIBLE_COUNT)
+        try:
+            self._wait(timeout).until(lambda d: counter.get_attribute("data-term") == expected)
+        except TimeoutException:
+            raise TimeoutException(f"La búsqueda '{term}' no se aplicó a la tabla")
+        return self
+    
+    def clear_search(self):
+        """
+        Quita el filtro de búsqueda
+        """
+        return self.search("")
+    
+    def get_visible_result_count(self):
+        """
+        Obtiene el número de registros que coinciden con la búsqueda
+        
+        Returns:
+            Número de registros listados (todos si no hay búsqueda)
+        """
+        return int(self.get_text(self.VISIBLE_COUNT))
+    
+    # ===== Métodos de Paginación y Consulta =====
+    
+    def set_page_size(self, size):
+        """
+        Selecciona el número de registros por página
+        
+        Args:
+            size: Registros por página (0 = todos)
+        """
+        Select(self.find_element(self.PAGE_SIZE_SELECT)).select_by_value(str(size))
+        return self
+    
+    def click_next_page(self):
+        """
+        Hace clic en el botón de página siguiente
+        """
+        self.click_element(self.NEXT_PAGE_BUTTON)
+        return self
+    
+    def click_prev_page(self):
+        """
+        Hace clic en el botón de página anterior
+        """
+        self.click_element(self.PREV_PAGE_BUTTON)
+        return self
+    
+    def get_page_indicator(self):
+        """
+        Obtiene el texto del indicador de página
+        
+        Returns:
+            Texto como "Página 1 de 3"
+        """
+        return self.get_text(self.PAGE_INDICATOR)
+    
+    def goto_page(self, page):
+        """
+        Muestra una página de la tabla directamente, sin recorrer las anteriores
+        
+        Args:
+            page: Número de página (desde 1)
+            
+        Returns:
+            Número de página mostrado (ajustado al rango válido)
+        """
+        return self.execute_script(GOTO_PAGE_SCRIPT, page)
+    
+    def query_records(self, search=None, category=None, sort_by="id", order="desc",
+                      page=1, page_size=0):
+        """
+        Consulta registros en la aplicación sin leer la tabla
+        
+        Args:
+            search: Texto a buscar en nombre, descripción o categoría
+            category: Categoría exacta
+            sort_by: Campo de orden (id, name, category, date)
+            order: asc o desc
+            page: Número de página (desde 1)
+            page_size: Registros por página (0 = todos)
+            
+        Returns:
+            Diccionario con total, page, pageSize, pageCount y records
+        """
+        options = {
+            "search": search or "",
+            "category": category or "",
+            "sortBy": sort_by,
+            "order": order,
+            "page": page,
+            "pageSize": page_size,
+        }
+        return self.execute_script(QUERY_RECORDS_SCRIPT, options)
+    
+    # ===== Métodos de Datos de Prueba =====
+    
+    def seed_records(self, records, append=False):
+        """
+        Carga registros directamente en el almacenamiento de la app (IndexedDB
+        o localStorage) y recarga la página una vez
+        
+        Mucho más rápido que create_record() para preparar precondiciones.
+        
+        Args:
+            records: Lista de diccionarios con name y opcionalmente
+                description, category y date
+            append: Si debe conservar los registros existentes
+            
+        Returns:
+            Lista de registros guardados (con id y createdAt)
+        """
+        seeded = self._run_async_script(SEED_RECORDS_SCRIPT, list(records), append)
+        self.refresh_page()
+        return seeded
+    
+    def wait_for_persisted(self):
+        """
+        Espera a que los cambios hechos en la app estén guardados
+        
+        La app agrupa las escrituras y las hace cuando el navegador queda
+        ocioso; esto espera a esa escritura en lugar de un tiempo fijo.
+        Si la escritura falla lanza RuntimeError con el error de la app.
+        
+        Returns:
+            Versión de los registros guardada, o None si la app no está cargada
+        """
+        return self._run_async_script(WAIT_FOR_PERSISTED_SCRIPT)
+    
+    def snapshot_records(self):
+        """
+        Lee todos los registros guardados en una sola llamada, después de
+        esperar a que se guarden los cambios pendientes
+        
+        Returns:
+            Lista de diccionarios con los registros guardados
+        """
+        return self._run_async_script(SNAPSHOT_RECORDS_SCRIPT)
     
     # ===== Métodos del Modal Crear/Editar =====
     
@@ -171,11 +540,23 @@ class CRUDPage(BasePage):
         # Scroll al botón y esperar a que sea clickeable
         button = self.find_element(self.NEW_RECORD_BUTTON)
         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-        time.sleep(0.3)
         self.click_element(self.NEW_RECORD_BUTTON)
-        time.sleep(0.8)  # Esperar animación del modal
+        self.wait_for_record_modal_open()
         return self
     
+    def wait_for_record_modal_open(self):
+        """
+        Espera a que el modal de registro se muestre y termine su animación
+        """
+        self.wait_for_class(self.RECORD_MODAL, "show")
+        self.wait_for_animations(self.RECORD_MODAL)
+    
+    def wait_for_record_modal_closed(self):
+        """
+        Espera a que el modal de registro se cierre
+        """
+        self.wait_for_class_removed(self.RECORD_MODAL, "show")
+    
     def is_modal_visible(self):
         """
         Verifica si el modal está visible
@@ -222,7 +603,6 @@ class CRUDPage(BasePage):
             category: Categoría a seleccionar
         """
         element = self.find_element(self.RECORD_CATEGORY_INPUT)
-        from selenium.webdriver.support.ui import Select
         select = Select(element)
         select.select_by_visible_text(category)
         return self
@@ -237,12 +617,33 @@ class CRUDPage(BasePage):
         self.send_keys(self.RECORD_DATE_INPUT, date)
         return self
     
+    def is_record_form_valid(self):
+        """
+        Verifica si el formulario del modal pasa la validación nativa (required, maxlength)
+        
+        Returns:
+            True si el navegador permitiría enviarlo
+        """
+        form = self.find_element(self.RECORD_FORM)
+        return self.execute_script("return arguments[0].checkValidity();", form)
+    
     def click_save(self):
         """
         Hace clic en el botón de guardar
+        
+        Si el formulario no pasa la validación nativa (p. ej. nombre vacío),
+        el navegador bloquea el envío y la página no cambia: se hace clic y
+        se retorna sin esperar.
         """
+        if not self.is_record_form_valid():
+            self.click_element(self.SAVE_BUTTON)
+            return self
+        
+        # Guardar produce un cierre del modal, una alerta de la app o un confirm()
+        self.watch_mutations(self.RECORD_MODAL)
+        self.watch_mutations(self.ALERT_CONTAINER)
         self.click_element(self.SAVE_BUTTON)
-        time.sleep(0.5)  # Esperar que se guarde
+        self.wait_for_any_mutation([self.RECORD_MODAL, self.ALERT_CONTAINER])
         return self
     
     def click_cancel(self):
@@ -250,7 +651,7 @@ class CRUDPage(BasePage):
         Hace clic en el botón de cancelar
         """
         self.click_element(self.CANCEL_BUTTON)
-        time.sleep(0.5)  # Esperar animación
+        self.wait_for_record_modal_closed()
         return self
     
     def create_record(self, name, description="", category="", date=""):
@@ -264,7 +665,6 @@ class CRUDPage(BasePage):
             date: Fecha del registro
         """
         self.click_new_record()
-        time.sleep(0.5)  # Esperar a que modal abra completamente
         self.enter_record_name(name)
         
         if description:
@@ -279,17 +679,11 @@ class CRUDPage(BasePage):
         self.click_save()
         
         # Manejar alert de fecha futura si aparece
-        try:
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            WebDriverWait(self.driver, 2).until(EC.alert_is_present())
-            alert = self.driver.switch_to.alert
-            alert.accept()  # Aceptar el alert
-            time.sleep(0.3)
-        except:
-            pass  # No hay alert, continuar normalmente
-        
-        time.sleep(0.5)  # Esperar confirmación
+        if self.is_js_alert_present():
+            self.accept_alert()
+        
+        # El registro queda guardado y renderizado cuando el modal se cierra
+        self.wait_for_record_modal_closed()
         return self
     
     # ===== Métodos para Editar =====
@@ -301,11 +695,8 @@ class CRUDPage(BasePage):
         Args:
             name: Nombre del registro a editar
         """
-        row = self.get_record_by_name(name)
-        if row:
-            edit_button = row.find_element(By.CLASS_NAME, "btn-edit")
-            edit_button.click()
-            time.sleep(0.5)  # Esperar animación del modal
+        if self._click_row_action(name, "btn-edit"):
+            self.wait_for_record_modal_open()
             return True
         return False
     
@@ -323,7 +714,6 @@ class CRUDPage(BasePage):
         if self.click_edit_button_by_name(old_name):
             self.enter_record_name(new_name)
             self.click_save()
-            time.sleep(0.5)
             return True
         return False
     
@@ -336,11 +726,9 @@ class CRUDPage(BasePage):
         Args:
             name: Nombre del registro a eliminar
         """
-        row = self.get_record_by_name(name)
-        if row:
-            delete_button = row.find_element(By.CLASS_NAME, "btn-delete")
-            delete_button.click()
-            time.sleep(0.5)  # Esperar animación del modal
+        if self._click_row_action(name, "btn-delete"):
+            self.wait_for_class(self.DELETE_MODAL, "show")
+            self.wait_for_animations(self.DELETE_MODAL)
             return True
         return False
     
@@ -357,8 +745,10 @@ class CRUDPage(BasePage):
         """
         Confirma la eliminación
         """
+        self.watch_mutations(self.TABLE_BODY)
         self.click_element(self.CONFIRM_DELETE_BUTTON)
-        time.sleep(0.5)  # Esperar que se elimine
+        self.wait_for_mutation(self.TABLE_BODY)
+        self.wait_for_class_removed(self.DELETE_MODAL, "show")
         return self
     
     def cancel_delete(self):
@@ -366,7 +756,7 @@ class CRUDPage(BasePage):
         Cancela la eliminación
         """
         self.click_element(self.CANCEL_DELETE_BUTTON)
-        time.sleep(0.5)  # Esperar animación
+        self.wait_for_class_removed(self.DELETE_MODAL, "show")
         return self
     
     def delete_record_by_name(self, name, confirm=True):
@@ -3,9 +3,19 @@ login_page.py - Page Object para la página de login
 """
 
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
 
 
+# Configura la espera de redirección de login.js (window.LOGIN_CONFIG)
+SET_REDIRECT_DELAY_SCRIPT = """
+window.LOGIN_CONFIG = Object.assign(window.LOGIN_CONFIG || {}, {redirectDelay: arguments[0]});
+"""
+
+# Destino de la redirección si login.js ya emitió la señal, o null
+REDIRECT_READY_SCRIPT = "return document.documentElement.dataset.redirectReady || null;"
+
+
 class LoginPage(BasePage):
     """
     Page Object para la página de autenticación
@@ -23,11 +33,52 @@ class LoginPage(BasePage):
         self.base_url = base_url
         self.url = f"{base_url}/login.html"
     
-    def navigate(self):
+    def navigate(self, redirect_delay=None):
         """
         Navega a la página de login
+        
+        Args:
+            redirect_delay: Espera en ms antes de redirigir tras el login
+                (parámetro redirectDelay); None usa la de la aplicación
+        """
+        url = self.url
+        if redirect_delay is not None:
+            url = f"{url}?redirectDelay={int(redirect_delay)}"
+        self.invalidate_element_cache()
+        self.driver.get(url)
+        return self
+    
+    def set_redirect_delay(self, delay_ms):
+        """
+        Cambia la espera antes de redirigir tras un login exitoso
+        
+        Inyecta window.LOGIN_CONFIG en la página cargada; el parámetro
+        redirectDelay de la URL tiene prioridad.
+        
+        Args:
+            delay_ms: Milisegundos de espera (0 redirige en cuanto se pinta la alerta)
+        """
+        self.execute_script(SET_REDIRECT_DELAY_SCRIPT, delay_ms)
+        return self
+    
+    def inject_session(self, username):
         """
-        self.driver.get(self.url)
+        Crea la sesión autenticada directamente en sessionStorage, igual que
+        handleSuccessfulLogin en login.js, sin usar el formulario
+        
+        Requiere que la página de login esté cargada (mismo origen que la app).
+        
+        Args:
+            username: Nombre de usuario de la sesión
+        """
+        self.execute_script(
+            """
+            sessionStorage.setItem('isAuthenticated', 'true');
+            sessionStorage.setItem('currentUser', arguments[0]);
+            sessionStorage.setItem('loginTime', new Date().toISOString());
+            """,
+            username,
+        )
         return self
     
     def enter_username(self, username):
@@ -90,6 +141,17 @@ class LoginPage(BasePage):
             return self.get_text(self.ALERT_MESSAGE)
         return ""
     
+    def wait_for_alert(self, timeout=5):
+        """
+        Espera a que la alerta se muestre y termine su animación
+        
+        Args:
+            timeout: Tiempo máximo de espera
+        """
+        self.wait_for_class(self.ALERT_CONTAINER, "show", timeout)
+        self.wait_for_animations(self.ALERT_CONTAINER, timeout)
+        return self
+    
     def is_alert_error(self):
         """
         Verifica si la alerta es de error
@@ -139,3 +201,36 @@ class LoginPage(BasePage):
             True si se redirigió, False en caso contrario
         """
         return self.wait_for_url_contains("index.html", timeout)
+    
+    def get_redirect_target(self):
+        """
+        Obtiene el destino de la redirección si el login ya la programó
+        
+        Returns:
+            Página de destino o None
+        """
+        return self.execute_script(REDIRECT_READY_SCRIPT)
+    
+    def wait_for_redirect_ready(self, timeout=10):
+        """
+        Espera la señal de login.js de que la redirección está programada
+        
+        Con espera cero la página puede haber navegado ya; en ese caso
+        también se considera lista.
+        
+        Args:
+            timeout: Tiempo máximo de espera
+            
+        Returns:
+            True si la redirección está programada o ya ocurrió, False en caso contrario
+        """
+        def _ready(driver):
+            if not self.is_on_login_page():
+                return True
+            return self.get_redirect_target() is not None
+        
+        try:
+            self._wait(timeout).until(_ready)
+            return True
+        except TimeoutException:
+            return False
@@ -0,0 +1,171 @@
+"""
+record_table.py - Lectura estructurada de la tabla de registros
+
+Lee todo #table-body en una sola llamada a execute_script y permite
+buscar filas en Python sin más comandos de WebDriver.
+
+Con muchos registros la tabla solo renderiza las filas visibles
+(tabla por ventanas) o una página; las filas fuera de la ventana o de la
+página actual se alcanzan con SCROLL_TO_RECORD_SCRIPT.
+"""
+
+
+# Devuelve cada fila renderizada como {id, cells}; cells sigue el orden de
+# las columnas. Los espaciadores de la tabla por ventanas no tienen data-id.
+READ_TABLE_SCRIPT = """
+const rows = document.querySelectorAll('#table-body tr[data-id]');
+const container = document.getElementById('table-container');
+const manager = window.recordManager;
+return {
+    virtualized: Boolean(container && container.classList.contains('virtualized')),
+    paginated: Boolean(manager && manager.isPaginated()),
+    rows: Array.from(rows, tr => ({
+        id: tr.getAttribute('data-id'),
+        cells: Array.from(tr.cells, td => td.innerText.trim())
+    }))
+};
+"""
+
+# Muestra la página de un registro y desplaza la tabla hasta él (por ID o
+# por el primer nombre que coincida en la lista actual, filtrada si hay una
+# búsqueda activa). Devuelve su ID, o null si no está en la lista
+SCROLL_TO_RECORD_SCRIPT = """
+const manager = window.recordManager;
+const name = arguments[1];
+let id = arguments[0];
+if (id === null) {
+    id = manager.getListIds().find(candidate => manager.recordsById.get(candidate).name === name);
+}
+if (id === undefined || id === null) return null;
+return manager.scrollToRecord(String(id)) ? String(id) : null;
+"""
+
+
+class TableRow:
+    """
+    Fila de la tabla de registros leída del DOM
+    """
+
+    # Índices de columna: 0=ID, 1=Nombre, 2=Descripción, 3=Categoría, 4=Fecha, 5=Acciones
+    ID_COLUMN = 0
+    NAME_COLUMN = 1
+    DESCRIPTION_COLUMN = 2
+    CATEGORY_COLUMN = 3
+    DATE_COLUMN = 4
+
+    def __init__(self, record_id, cells):
+        self.record_id = record_id
+        self.cells = cells
+
+    def _cell(self, index):
+        return self.cells[index] if len(self.cells) > index else ""
+
+    @property
+    def name(self):
+        return self._cell(self.NAME_COLUMN)
+
+    @property
+    def description(self):
+        return self._cell(self.DESCRIPTION_COLUMN)
+
+    @property
+    def category(self):
+        return self._cell(self.CATEGORY_COLUMN)
+
+    @property
+    def date(self):
+        return self._cell(self.DATE_COLUMN)
+
+    def __repr__(self):
+        return f"TableRow(id={self.record_id!r}, name={self.name!r})"
+
+
+class TableSnapshot:
+    """
+    Contenido de la tabla en un instante, indexado por id, nombre y categoría
+    """
+
+    def __init__(self, rows, virtualized=False, paginated=False):
+        self.rows = rows
+        # True si la tabla solo tenía renderizadas las filas visibles
+        self.virtualized = virtualized
+        # True si la tabla solo mostraba una página de registros
+        self.paginated = paginated
+        self._by_id = {}
+        self._by_name = {}
+        self._by_category = {}
+
+        for row in rows:
+            self._by_id[row.record_id] = row
+            self._by_name.setdefault(row.name, []).append(row)
+            self._by_category.setdefault(row.category, []).append(row)
+
+    @classmethod
+    def from_script_result(cls, data):
+        """
+        Construye el snapshot a partir del resultado de READ_TABLE_SCRIPT
+
+        Args:
+            data: Diccionario {virtualized, paginated, rows} con rows como
+                lista de {id, cells}
+
+        Returns:
+            TableSnapshot
+        """
+        data = data or {}
+        rows = [TableRow(item["id"], item["cells"]) for item in data.get("rows", [])]
+        return cls(
+            rows,
+            virtualized=bool(data.get("virtualized")),
+            paginated=bool(data.get("paginated")),
+        )
+
+    @property
+    def is_partial(self):
+        """
+        True si hay registros que no estaban renderizados en la tabla
+        """
+        return self.virtualized or self.paginated
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def find_by_id(self, record_id):
+        """
+        Busca una fila por ID
+
+        Returns:
+            TableRow o None
+        """
+        return self._by_id.get(str(record_id))
+
+    def find_by_name(self, name):
+        """
+        Busca la primera fila (en orden de la tabla) con el nombre dado
+
+        Returns:
+            TableRow o None
+        """
+        matches = self._by_name.get(name)
+        return matches[0] if matches else None
+
+    def filter_by_category(self, category):
+        """
+        Obtiene las filas de una categoría
+
+        Returns:
+            Lista de TableRow
+        """
+        return list(self._by_category.get(category, []))
+
+    def names(self):
+        """
+        Obtiene los nombres en el orden de la tabla
+
+        Returns:
+            Lista de nombres
+        """
+        return [row.name for row in self.rows]
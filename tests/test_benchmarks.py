@@ -0,0 +1,93 @@
+"""
+test_benchmarks.py - Micro-benchmarks de los Page Objects y del renderizado
+
+Mide las operaciones de CRUDPage que usan las pruebas y RecordManager.renderTable
+con tablas precargadas de 10, 100, 1000 y 10000 registros. Solo se ejecutan
+con --run-benchmarks; los resultados se escriben en JSON (--benchmark-json) y,
+con --benchmark-baseline, la prueba falla si alguna operación empeora más que
+el umbral (--benchmark-threshold).
+"""
+
+import pytest
+
+from utils.benchmark import BENCHMARK_SIZES, get_benchmark_recorder
+
+
+# Muestras (ms) de renderTable, forzando el layout para incluir su costo
+MEASURE_RENDER_TABLE_SCRIPT = """
+const manager = window.recordManager;
+const runs = arguments[0];
+const samples = [];
+for (let i = 0; i < runs; i++) {
+    const start = performance.now();
+    manager.renderTable();
+    document.body.offsetHeight;
+    samples.push(performance.now() - start);
+}
+return samples;
+"""
+
+# Rondas por operación: las que abren modales son más lentas
+ROUNDS = 5
+MODAL_ROUNDS = 3
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", BENCHMARK_SIZES)
+def test_benchmark_crud_page_operations(authenticated_crud_page, size):
+    """
+    BENCHMARK: Operaciones de CRUDPage y renderTable con N registros
+
+    Mide create_record, get_record_by_name, get_total_count,
+    update_record_name, delete_record_by_name y renderTable, y las compara
+    con la línea base si se indicó una.
+    """
+    page = authenticated_crud_page
+    recorder = get_benchmark_recorder()
+    page.seed_records([
+        {"name": f"Registro {i}", "description": f"Descripción {i}", "category": "Trabajo"}
+        for i in range(size)
+    ])
+    middle = f"Registro {size // 2}"
+
+    results = [
+        recorder.measure(
+            "get_total_count", size,
+            lambda i: page.get_total_count(),
+            rounds=ROUNDS,
+        ),
+        recorder.measure(
+            "get_record_by_name", size,
+            lambda i: page.get_record_by_name(middle),
+            rounds=ROUNDS,
+        ),
+        recorder.measure(
+            "create_record", size,
+            lambda i: page.create_record(f"Bench {i}", "Medición", "Trabajo"),
+            rounds=MODAL_ROUNDS,
+        ),
+        recorder.measure(
+            "update_record_name", size,
+            lambda i: page.update_record_name(f"Bench {i}", f"Bench editado {i}"),
+            rounds=MODAL_ROUNDS,
+            after_each=lambda i: page.wait_for_record_modal_closed(),
+        ),
+        recorder.measure(
+            "delete_record_by_name", size,
+            lambda i: page.delete_record_by_name(f"Bench editado {i}"),
+            rounds=MODAL_ROUNDS,
+        ),
+        recorder.add(
+            "renderTable", size,
+            page.execute_script(MEASURE_RENDER_TABLE_SCRIPT, ROUNDS),
+        ),
+    ]
+
+    for result in results:
+        print(f"{result['name']}[{size}]: mediana {result['median_ms']:.1f} ms, "
+              f"p95 {result['p95_ms']:.1f} ms")
+
+    assert page.get_total_count() == size, "Las operaciones medidas dejaron registros extra"
+
+    regressions = recorder.regressions(results)
+    assert not regressions, "Regresiones respecto de la línea base:\n" + "\n".join(regressions)
@@ -7,27 +7,9 @@ creación de registros, incluyendo camino feliz, pruebas negativas y de límites
 """
 
 import pytest
-from pages.login_page import LoginPage
-from pages.crud_page import CRUDPage
 import time
 
 
-@pytest.fixture(scope="function")
-def authenticated_crud_page(driver, base_url, clean_session):
-    """
-    Fixture que proporciona una página CRUD autenticada
-    """
-    login_page = LoginPage(driver, base_url)
-    crud_page = CRUDPage(driver, base_url)
-    
-    # Autenticarse
-    login_page.navigate()
-    login_page.login("admin", "admin123")
-    time.sleep(2)
-    
-    return crud_page
-
-
 @pytest.mark.crud
 @pytest.mark.create
 @pytest.mark.happy_path
@@ -343,3 +325,81 @@ def test_create_record_cancel(authenticated_crud_page, take_screenshot):
     
     take_screenshot("create_cancel_05_validacion")
     print("✅ Cancelación funciona correctamente")
+
+
+@pytest.mark.crud
+@pytest.mark.create
+@pytest.mark.happy_path
+@pytest.mark.parametrize("storage", ["indexedDB", "localStorage"])
+def test_create_record_persisted(authenticated_crud_page, take_screenshot, storage):
+    """
+    PRUEBA: Registro creado se guarda y sobrevive a recargar (Camino Feliz)
+    
+    Verifica, con IndexedDB y con el respaldo en localStorage, que el
+    guardado por lotes escriba el registro y que siga en la tabla después
+    de recargar la página.
+    """
+    # Arrange
+    page = authenticated_crud_page
+    if storage == "localStorage":
+        page.navigate(storage="localStorage")
+    assert page.get_storage_backend() == storage, f"La app no usa {storage}"
+    
+    # Act
+    page.create_record("Registro Persistido", "Guardado por lotes", "Personal")
+    page.wait_for_persisted()
+    
+    # Assert
+    stored = [record["name"] for record in page.snapshot_records()]
+    assert "Registro Persistido" in stored, f"El registro no se guardó en {storage}"
+    
+    page.refresh_page()
+    assert page.get_record_by_name("Registro Persistido") is not None, \
+        "El registro no aparece después de recargar"
+    
+    take_screenshot(f"create_persisted_01_recargado_{storage}")
+    print("✅ Registro guardado correctamente")
+
+
+# Entradas maliciosas: se deben mostrar como texto, nunca interpretarse como HTML
+XSS_PAYLOADS = [
+    "<script>window.__xss = 1</script>",
+    "<img src=x onerror=\"window.__xss = 1\">",
+    "\"><svg onload=window.__xss=1>",
+    "'><iframe src=javascript:window.__xss=1>",
+    "&lt;b&gt;entidad&lt;/b&gt; & <b>negrita</b>",
+]
+
+
+@pytest.mark.crud
+@pytest.mark.create
+@pytest.mark.negative
+@pytest.mark.parametrize("payload", XSS_PAYLOADS)
+def test_create_record_malicious_input(authenticated_crud_page, take_screenshot, payload):
+    """
+    PRUEBA: Crear registro con HTML malicioso (Negativa)
+    
+    Verifica que el nombre y la descripción con HTML o scripts se muestren
+    como texto literal en la tabla, sin crear elementos ni ejecutar código.
+    """
+    # Arrange
+    page = authenticated_crud_page
+    
+    # Act
+    page.create_record(name=payload, description=payload, category="Trabajo")
+    
+    # Assert - el texto se muestra tal cual
+    row = page.find_record(name=payload)
+    assert row is not None, "El registro no aparece con su nombre literal"
+    assert row.description == payload, f"Descripción alterada: {row.description!r}"
+    
+    injected = page.execute_script(
+        "return document.querySelectorAll("
+        "'#table-body script, #table-body img, #table-body svg, #table-body iframe, #table-body b'"
+        ").length;"
+    )
+    assert injected == 0, "La tabla contiene elementos creados desde la entrada"
+    assert page.execute_script("return window.__xss === undefined;"), "Se ejecutó código inyectado"
+    
+    take_screenshot("create_xss_01_texto_literal")
+    print("✅ Entrada maliciosa mostrada como texto")
@@ -7,24 +7,9 @@ eliminación de registros con confirmación.
 """
 
 import pytest
-from pages.login_page import LoginPage
-from pages.crud_page import CRUDPage
 import time
 
 
-@pytest.fixture(scope="function")
-def authenticated_crud_page(driver, base_url, clean_session):
-    """Fixture que proporciona una página CRUD autenticada"""
-    login_page = LoginPage(driver, base_url)
-    crud_page = CRUDPage(driver, base_url)
-    
-    login_page.navigate()
-    login_page.login("admin", "admin123")
-    time.sleep(2)
-    
-    return crud_page
-
-
 @pytest.mark.crud
 @pytest.mark.delete
 @pytest.mark.happy_path
@@ -138,13 +123,12 @@ def test_delete_multiple_records(authenticated_crud_page, take_screenshot):
     page = authenticated_crud_page
     take_screenshot("delete_multi_01_inicio")
     
-    # Crear 3 registros
-    page.create_record("A Eliminar 1", "Primero")
-    time.sleep(0.5)
-    page.create_record("A Eliminar 2", "Segundo")
-    time.sleep(0.5)
-    page.create_record("A Eliminar 3", "Tercero")
-    time.sleep(1)
+    # Cargar 3 registros directamente (la creación se prueba en test_crud_create)
+    page.seed_records([
+        {"name": "A Eliminar 1", "description": "Primero"},
+        {"name": "A Eliminar 2", "description": "Segundo"},
+        {"name": "A Eliminar 3", "description": "Tercero"},
+    ], append=True)
     take_screenshot("delete_multi_02_tres_creados")
     
     initial_count = page.get_total_count()
@@ -7,24 +7,9 @@ consulta y visualización de registros.
 """
 
 import pytest
-from pages.login_page import LoginPage
-from pages.crud_page import CRUDPage
 import time
 
 
-@pytest.fixture(scope="function")
-def authenticated_crud_page(driver, base_url, clean_session):
-    """Fixture que proporciona una página CRUD autenticada"""
-    login_page = LoginPage(driver, base_url)
-    crud_page = CRUDPage(driver, base_url)
-    
-    login_page.navigate()
-    login_page.login("admin", "admin123")
-    time.sleep(2)
-    
-    return crud_page
-
-
 @pytest.mark.crud
 @pytest.mark.read
 @pytest.mark.happy_path
@@ -177,3 +162,197 @@ def test_read_total_count(authenticated_crud_page, take_screenshot):
     
     take_screenshot("read_count_03_despues_segundo")
     print(f"✅ Contador actualizado correctamente: {initial_count} → {count_after_second}")
+
+
+@pytest.mark.crud
+@pytest.mark.read
+@pytest.mark.happy_path
+def test_read_seeded_records(authenticated_crud_page, take_screenshot):
+    """
+    PRUEBA: Visualizar registros cargados en bloque (Camino Feliz)
+    
+    Verifica que la tabla y el contador reflejen registros cargados
+    directamente en localStorage.
+    """
+    # Arrange
+    page = authenticated_crud_page
+    records = [
+        {"name": f"Registro Masivo {i}", "description": f"Carga {i}", "category": "Estudio"}
+        for i in range(50)
+    ]
+    
+    # Act
+    seeded = page.seed_records(records)
+    take_screenshot("read_seeded_01_cargados")
+    
+    # Assert
+    ids = [record["id"] for record in seeded]
+    assert len(set(ids)) == len(ids), "Los IDs generados no son únicos"
+    
+    assert page.get_total_count() == 50, \
+        f"Contador incorrecto. Esperado: 50, Actual: {page.get_total_count()}"
+    
+    stored = page.snapshot_records()
+    assert [r["name"] for r in stored] == [r["name"] for r in records], \
+        "Los registros guardados no coinciden con los cargados"
+    
+    assert page.get_record_by_name("Registro Masivo 49") is not None, \
+        "El último registro cargado no aparece en la tabla"
+    
+    take_screenshot("read_seeded_02_validacion")
+    print("✅ 50 registros cargados en bloque correctamente")
+
+
+@pytest.mark.crud
+@pytest.mark.read
+@pytest.mark.happy_path
+def test_read_records_paginated(authenticated_crud_page, take_screenshot):
+    """
+    PRUEBA: Navegar la tabla por páginas (Camino Feliz)
+    
+    Verifica que al elegir un tamaño de página la tabla muestre solo esa
+    cantidad de filas y que los controles recorran las páginas.
+    """
+    # Arrange
+    page = authenticated_crud_page
+    page.seed_records([{"name": f"Registro {i}", "category": "Trabajo"} for i in range(25)])
+    
+    # Act
+    page.set_page_size(10)
+    take_screenshot("read_paginated_01_pagina_1")
+    
+    # Assert - la primera página tiene los 10 registros más recientes
+    assert page.get_page_indicator() == "Página 1 de 3"
+    assert page.read_table().names() == [f"Registro {i}" for i in range(24, 14, -1)]
+    assert page.get_total_count() == 25, "El contador debe reflejar todos los registros"
+    
+    page.click_next_page()
+    assert page.get_page_indicator() == "Página 2 de 3"
+    assert page.find_record(name="Registro 14") is not None
+    
+    assert page.goto_page(3) == 3
+    assert page.get_table_row_count() == 5, "La última página debería tener 5 filas"
+    
+    # Un registro de otra página se alcanza cambiando de página
+    assert page.click_edit_button_by_name("Registro 20"), "No se encontró el registro"
+    assert page.get_page_indicator() == "Página 1 de 3"
+    page.click_cancel()
+    
+    take_screenshot("read_paginated_02_navegacion")
+    print("✅ Paginación verificada correctamente")
+
+
+@pytest.mark.crud
+@pytest.mark.read
+@pytest.mark.happy_path
+def test_query_records_api(authenticated_crud_page):
+    """
+    PRUEBA: Consultar registros filtrados y paginados sin leer la tabla (Camino Feliz)
+    
+    Verifica que window.queryRecords filtre, ordene y pagine los registros
+    de la aplicación.
+    """
+    # Arrange
+    page = authenticated_crud_page
+    categories = ["Trabajo", "Personal", "Estudio"]
+    page.seed_records([
+        {"name": f"Registro {i}", "description": f"Nota {i}", "category": categories[i % 3]}
+        for i in range(30)
+    ])
+    
+    # Act
+    result = page.query_records(category="Personal", page=2, page_size=4)
+    
+    # Assert - 10 registros Personal (1, 4, ..., 28), más recientes primero
+    assert result["total"] == 10
+    assert result["pageCount"] == 3
+    assert [r["name"] for r in result["records"]] == [
+        "Registro 16", "Registro 13", "Registro 10", "Registro 7"
+    ]
+    
+    by_name = page.query_records(search="nota 2", sort_by="name", order="asc")
+    assert [r["name"] for r in by_name["records"]][:3] == ["Registro 2", "Registro 20", "Registro 21"]
+    
+    # La consulta no cambia la tabla
+    assert page.get_table_row_count() == 30
+
+
+@pytest.mark.crud
+@pytest.mark.read
+@pytest.mark.boundary
+def test_read_records_with_duplicate_ids(authenticated_crud_page):
+    """
+    PRUEBA: Registros guardados con IDs repetidos se migran al cargar (Límite)
+    
+    Verifica que los registros antiguos creados en el mismo milisegundo
+    (mismo ID) reciban IDs únicos y se puedan editar por separado.
+    """
+    # Arrange - formato original en localStorage con un ID repetido
+    page = authenticated_crud_page
+    page.navigate(storage="localStorage")
+    page.execute_script("""
+        localStorage.setItem('records', JSON.stringify([
+            {id: '1700000000000', name: 'Duplicado A', description: '', category: '', date: ''},
+            {id: '1700000000000', name: 'Duplicado B', description: '', category: '', date: ''}
+        ]));
+    """)
+    
+    # Act
+    page.refresh_page()
+    
+    # Assert
+    stored = page.snapshot_records()
+    ids = [record["id"] for record in stored]
+    assert len(ids) == 2, "Se perdió un registro en la migración"
+    assert len(set(ids)) == 2, f"Los IDs siguen repetidos: {ids}"
+    
+    assert page.update_record_name("Duplicado B", "Duplicado B editado"), "No se encontró el registro"
+    assert page.find_record(name="Duplicado A") is not None, "Se modificó el registro equivocado"
+    assert page.find_record(name="Duplicado B editado") is not None
+
+
+@pytest.mark.crud
+@pytest.mark.read
+@pytest.mark.happy_path
+def test_search_records(authenticated_crud_page, take_screenshot):
+    """
+    PRUEBA: Buscar registros por nombre, descripción o categoría (Camino Feliz)
+    
+    Verifica que el buscador filtre la tabla mientras se escribe, sin
+    distinguir mayúsculas ni acentos, y que al borrarlo se vean todos.
+    """
+    # Arrange
+    page = authenticated_crud_page
+    categories = ["Trabajo", "Personal", "Estudio"]
+    page.seed_records([
+        {"name": f"Registro {i}", "description": f"Nota número {i}", "category": categories[i % 3]}
+        for i in range(30)
+    ])
+    
+    # Act & Assert - por nombre: "Registro 1" y "Registro 10" a "Registro 19"
+    page.search("registro 1")
+    take_screenshot("read_search_01_por_nombre")
+    assert page.get_visible_result_count() == 11
+    assert sorted(page.read_table().names()) == sorted(
+        ["Registro 1"] + [f"Registro {i}" for i in range(10, 20)]
+    )
+    
+    # Por descripción, sin acentos
+    page.search("numero 25")
+    assert page.read_table().names() == ["Registro 25"]
+    
+    # Por categoría
+    page.search("ESTUDIO")
+    assert page.get_visible_result_count() == 10
+    
+    # Sin resultados y sin filtro
+    page.search("no existe")
+    assert page.get_visible_result_count() == 0
+    assert page.get_table_row_count() == 0
+    
+    page.clear_search()
+    assert page.get_visible_result_count() == 30
+    assert page.get_total_count() == 30
+    
+    take_screenshot("read_search_02_sin_filtro")
+    print("✅ Búsqueda verificada correctamente")
@@ -7,24 +7,9 @@ actualización de registros existentes.
 """
 
 import pytest
-from pages.login_page import LoginPage
-from pages.crud_page import CRUDPage
 import time
 
 
-@pytest.fixture(scope="function")
-def authenticated_crud_page(driver, base_url, clean_session):
-    """Fixture que proporciona una página CRUD autenticada"""
-    login_page = LoginPage(driver, base_url)
-    crud_page = CRUDPage(driver, base_url)
-    
-    login_page.navigate()
-    login_page.login("admin", "admin123")
-    time.sleep(2)
-    
-    return crud_page
-
-
 @pytest.mark.crud
 @pytest.mark.update
 @pytest.mark.happy_path
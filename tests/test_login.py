@@ -9,7 +9,6 @@ del sistema de login, incluyendo camino feliz y pruebas negativas.
 import pytest
 from pages.login_page import LoginPage
 from pages.crud_page import CRUDPage
-import time
 
 
 @pytest.mark.login
@@ -26,19 +25,20 @@ def test_login_happy_path(driver, base_url, clean_session, take_screenshot):
     crud_page = CRUDPage(driver, base_url)
     
     # Act
-    login_page.navigate()
+    login_page.navigate(redirect_delay=0)
     take_screenshot("login_01_pagina_inicial")
     
     login_page.login("admin", "admin123")
     take_screenshot("login_02_credenciales_ingresadas")
     
-    # Esperar redirección
-    time.sleep(2)
-    take_screenshot("login_03_redireccion_exitosa")
+    # Esperar la señal de redirección en lugar de una pausa fija
+    assert login_page.wait_for_redirect_ready(timeout=10), \
+        "El login no programó la redirección"
     
     # Assert
     assert crud_page.wait_for_redirect_to_index(timeout=10), \
         "No se redirigió a la página principal"
+    take_screenshot("login_03_redireccion_exitosa")
     
     assert crud_page.is_authenticated(), \
         "El usuario no está autenticado"
@@ -51,6 +51,42 @@ def test_login_happy_path(driver, base_url, clean_session, take_screenshot):
     print("✅ Login exitoso - Usuario autenticado correctamente")
 
 
+@pytest.mark.login
+@pytest.mark.happy_path
+def test_login_success_alert_before_redirect(driver, base_url, clean_session, take_screenshot):
+    """
+    PRUEBA: Alerta de éxito visible antes de redirigir (Camino Feliz)
+    
+    Verifica que, con la espera configurada desde la prueba, la alerta de
+    éxito se muestre cuando el login emite la señal de redirección.
+    """
+    # Arrange
+    login_page = LoginPage(driver, base_url)
+    crud_page = CRUDPage(driver, base_url)
+    login_page.navigate()
+    login_page.set_redirect_delay(3000)
+    
+    # Act
+    login_page.login("admin", "admin123")
+    
+    # Assert
+    assert login_page.wait_for_redirect_ready(timeout=5), \
+        "El login no programó la redirección"
+    assert login_page.get_redirect_target() == "index.html", \
+        "Destino de redirección incorrecto"
+    
+    assert login_page.is_alert_success(), \
+        "La alerta no es de tipo éxito"
+    alert_message = login_page.get_alert_message()
+    assert "Inicio de sesión exitoso" in alert_message, \
+        f"Mensaje de éxito incorrecto. Obtenido: '{alert_message}'"
+    take_screenshot("login_alert_01_exito_visible")
+    
+    assert crud_page.wait_for_redirect_to_index(timeout=10), \
+        "No se redirigió a la página principal"
+    print("✅ Alerta de éxito observable antes de la redirección")
+
+
 @pytest.mark.login
 @pytest.mark.negative
 def test_login_invalid_credentials(driver, base_url, clean_session, take_screenshot):
@@ -71,7 +107,7 @@ def test_login_invalid_credentials(driver, base_url, clean_session, take_screens
     take_screenshot("login_invalid_02_credenciales_incorrectas")
     
     # Esperar que aparezca el mensaje de error
-    time.sleep(1)
+    login_page.wait_for_alert()
     take_screenshot("login_invalid_03_mensaje_error")
     
     # Assert
@@ -110,7 +146,7 @@ def test_login_empty_fields(driver, base_url, clean_session, take_screenshot):
     
     # Intentar login sin ingresar datos
     login_page.click_login()
-    time.sleep(1)
+    login_page.wait_for_alert()
     take_screenshot("login_empty_02_campos_vacios")
     
     # Assert
@@ -145,7 +181,7 @@ def test_login_empty_username(driver, base_url, clean_session, take_screenshot):
     
     login_page.enter_password("admin123")
     login_page.click_login()
-    time.sleep(1)
+    login_page.wait_for_alert()
     take_screenshot("login_empty_user_02_error")
     
     # Assert
@@ -176,7 +212,7 @@ def test_login_empty_password(driver, base_url, clean_session, take_screenshot):
     
     login_page.enter_username("admin")
     login_page.click_login()
-    time.sleep(1)
+    login_page.wait_for_alert()
     take_screenshot("login_empty_pass_02_error")
     
     # Assert
@@ -207,7 +243,7 @@ def test_login_multiple_failed_attempts(driver, base_url, clean_session, take_sc
     for i in range(3):
         login_page.clear_credentials()
         login_page.login("admin", f"wrongpass{i}")
-        time.sleep(1)
+        login_page.wait_for_alert()
         take_screenshot(f"login_multiple_02_intento_{i+1}")
     
     # Assert
@@ -0,0 +1,555 @@
+"""
+test_performance.py - Pruebas de rendimiento de la aplicación
+
+Este módulo mide dentro del navegador el costo de las operaciones de la
+tabla de registros con conjuntos de datos cargados en bloque, para
+verificar que escalen bien con el número de registros.
+
+Las pruebas que comparan tiempos medidos (marcador timing) dependen de la
+carga de la máquina y se omiten salvo que se pase --run-benchmarks; las
+demás verifican el comportamiento (filas renderizadas, escrituras,
+comandos WebDriver) y corren siempre.
+"""
+
+import pytest
+
+from utils.tracing import get_command_tracer
+
+
+# Mide (mediana en ms) insertar, actualizar y eliminar una fila de forma
+# incremental, y el costo de reconstruir la tabla completa. Desactiva la
+# tabla por ventanas para medir el DOM con todas las filas.
+MEASURE_ROW_OPERATIONS_SCRIPT = """
+const manager = window.recordManager;
+const runs = arguments[0];
+manager.virtualizationThreshold = Infinity;
+manager.renderTable();
+const median = values => values.sort((a, b) => a - b)[Math.floor(values.length / 2)];
+const times = {insert: [], patch: [], remove: []};
+
+for (let i = 0; i < runs; i++) {
+    const record = {id: String(9000000000000 + i), name: 'Bench ' + i, description: '', category: '', date: ''};
+
+    let start = performance.now();
+    manager.records.push(record);
+    manager.insertRow(record);
+    times.insert.push(performance.now() - start);
+
+    start = performance.now();
+    manager.patchRow({...record, name: 'Bench editado ' + i});
+    times.patch.push(performance.now() - start);
+
+    start = performance.now();
+    manager.records.pop();
+    manager.removeRow(record.id);
+    times.remove.push(performance.now() - start);
+}
+
+const start = performance.now();
+manager.renderTable();
+const fullRender = performance.now() - start;
+
+return {
+    insert: median(times.insert),
+    patch: median(times.patch),
+    remove: median(times.remove),
+    full_render: fullRender
+};
+"""
+
+
+def build_records(count):
+    """Genera datos de prueba para cargar en bloque"""
+    return [
+        {"name": f"Registro {i}", "description": f"Descripción {i}", "category": "Trabajo"}
+        for i in range(count)
+    ]
+
+
+@pytest.mark.performance
+@pytest.mark.timing
+def test_row_operations_cost_stays_flat(authenticated_crud_page):
+    """
+    PRUEBA: Costo por operación constante al crecer la tabla (Rendimiento)
+    
+    Verifica que insertar, actualizar o eliminar un registro solo toque su
+    fila, de modo que el costo no crezca con el número de registros.
+    """
+    page = authenticated_crud_page
+    
+    page.seed_records(build_records(100))
+    small = page.execute_script(MEASURE_ROW_OPERATIONS_SCRIPT, 20)
+    
+    page.seed_records(build_records(5000))
+    large = page.execute_script(MEASURE_ROW_OPERATIONS_SCRIPT, 20)
+    
+    print(f"100 registros: {small}")
+    print(f"5000 registros: {large}")
+    
+    for operation in ("insert", "patch", "remove"):
+        # 50 veces más registros no debe costar más de ~5 veces por operación
+        assert large[operation] <= small[operation] * 5 + 1.0, \
+            f"'{operation}' escala con el tamaño de la tabla: {small[operation]:.3f} ms → {large[operation]:.3f} ms"
+        
+        assert large[operation] < large["full_render"], \
+            f"'{operation}' no es más barato que reconstruir la tabla completa"
+    
+    assert page.get_total_count() == 5000, "El contador no coincide con los registros cargados"
+
+
+def count_click_listeners(driver, expression):
+    """
+    Cuenta los listeners de 'click' registrados en un nodo usando el
+    protocolo de DevTools de Chrome
+    """
+    node = driver.execute_cdp_cmd("Runtime.evaluate", {"expression": expression})
+    object_id = node["result"]["objectId"]
+    listeners = driver.execute_cdp_cmd(
+        "DOMDebugger.getEventListeners", {"objectId": object_id}
+    )["listeners"]
+    return len([listener for listener in listeners if listener["type"] == "click"])
+
+
+@pytest.mark.performance
+def test_row_actions_use_delegated_listener(authenticated_crud_page):
+    """
+    PRUEBA: Acciones de fila con un único listener delegado (Rendimiento)
+    
+    Verifica que las filas no registren listeners propios, que la tabla
+    tenga uno solo y que editar y eliminar sigan funcionando con muchos
+    registros cargados. El costo de renderizado se mide aparte en
+    test_delegated_listener_render_cost.
+    """
+    page = authenticated_crud_page
+    page.seed_records(build_records(300))
+    
+    driver = page.driver
+    assert count_click_listeners(driver, "document.querySelector('#table-body .btn-edit')") == 0, \
+        "Los botones de las filas no deberían tener listeners propios"
+    assert count_click_listeners(driver, "document.getElementById('table-body')") == 1, \
+        "La tabla debería tener un único listener delegado"
+    
+    # Las acciones siguen funcionando a través del listener delegado
+    assert page.click_edit_button_by_name("Registro 0"), "No se encontró el botón editar"
+    assert page.get_modal_title() == "Editar Registro", "No se abrió el modal de edición"
+    page.click_cancel()
+    
+    assert page.delete_record_by_name("Registro 1", confirm=True), "No se encontró el botón eliminar"
+    assert page.get_total_count() == 299, "El registro no se eliminó"
+
+
+# Mide (mediana en ms) renderizar todas las filas sin tabla por ventanas, con
+# el listener delegado actual y registrando además un listener por botón de
+# fila como hacía la implementación anterior
+MEASURE_LISTENER_RENDER_SCRIPT = """
+const manager = window.recordManager;
+const runs = arguments[0];
+const median = values => values.sort((a, b) => a - b)[Math.floor(values.length / 2)];
+const threshold = manager.virtualizationThreshold;
+manager.virtualizationThreshold = Infinity;
+const delegated = [];
+const perRow = [];
+const noop = () => {};
+
+for (let i = 0; i < runs; i++) {
+    let start = performance.now();
+    manager.renderTable();
+    document.body.offsetHeight;
+    delegated.push(performance.now() - start);
+
+    start = performance.now();
+    manager.renderTable();
+    manager.tableBody.querySelectorAll('.btn-edit, .btn-delete')
+        .forEach(button => button.addEventListener('click', noop));
+    document.body.offsetHeight;
+    perRow.push(performance.now() - start);
+}
+
+manager.virtualizationThreshold = threshold;
+manager.renderTable();
+return {
+    rows: manager.records.length,
+    delegated: median(delegated),
+    per_row: median(perRow)
+};
+"""
+
+
+@pytest.mark.performance
+@pytest.mark.timing
+def test_delegated_listener_render_cost(authenticated_crud_page):
+    """
+    PRUEBA: Renderizar sin listeners por fila es más barato (Rendimiento)
+    
+    Con 3000 filas renderizadas a la vez (sin tabla por ventanas), compara
+    el renderizado con el listener delegado contra el mismo renderizado
+    registrando un listener en cada botón de fila.
+    """
+    page = authenticated_crud_page
+    page.seed_records(build_records(3000))
+    
+    result = page.execute_script(MEASURE_LISTENER_RENDER_SCRIPT, 5)
+    print(f"Renderizado de {result['rows']} filas - delegado: {result['delegated']:.1f} ms, "
+          f"por fila: {result['per_row']:.1f} ms")
+    
+    assert result["rows"] == 3000
+    assert result["delegated"] < result["per_row"], \
+        "Renderizar con el listener delegado no es más barato que con listeners por fila"
+
+
+@pytest.mark.performance
+def test_large_table_renders_visible_window(authenticated_crud_page):
+    """
+    PRUEBA: Tabla por ventanas con muchos registros (Rendimiento)
+    
+    Verifica que con 1000 registros solo se rendericen las filas visibles,
+    que el contador refleje el total y que una fila fuera de la ventana se
+    pueda alcanzar desplazando la tabla.
+    """
+    page = authenticated_crud_page
+    page.seed_records(build_records(1000))
+    
+    rendered = page.get_table_row_count()
+    print(f"Filas renderizadas con 1000 registros: {rendered}")
+    
+    assert page.read_table().virtualized, "La tabla debería renderizarse por ventanas"
+    assert 0 < rendered < 200, f"Se renderizaron {rendered} filas de 1000"
+    assert page.get_total_count() == 1000, "El contador no coincide con los registros cargados"
+    
+    # "Registro 10" está al final de la tabla (IDs más antiguos)
+    record_id = page.scroll_to_record(name="Registro 10")
+    assert record_id is not None, "No se encontró el registro"
+    assert page.get_row_element(record_id).is_displayed(), "La fila no quedó visible"
+    
+    assert page.delete_record_by_name("Registro 11", confirm=True), "No se encontró el botón eliminar"
+    assert page.get_total_count() == 999, "El registro no se eliminó"
+
+
+# Crea registros seguidos y cuenta las escrituras al almacenamiento de la app
+COUNT_RECORD_WRITES_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const manager = window.recordManager;
+const count = arguments[0];
+const storage = manager.storage;
+const originalSaveChanges = storage.saveChanges;
+let writes = 0;
+let written = 0;
+storage.saveChanges = function (changes, records) {
+    writes++;
+    written += changes.size;
+    return originalSaveChanges.call(this, changes, records);
+};
+
+const start = performance.now();
+for (let i = 0; i < count; i++) {
+    manager.createRecord({name: 'Lote ' + i, description: '', category: '', date: ''});
+}
+const mutationMs = performance.now() - start;
+const writesBeforeFlush = writes;
+
+manager.whenPersisted().then(() => {
+    storage.saveChanges = originalSaveChanges;
+    done({
+        backend: storage.name,
+        writes_before_flush: writesBeforeFlush,
+        writes: writes,
+        records_written: written,
+        mutation_ms: mutationMs
+    });
+}).catch(error => {
+    // Una escritura fallida rechaza la espera: se reporta en lugar de
+    // esperar al timeout del script
+    storage.saveChanges = originalSaveChanges;
+    done({error: String(error)});
+});
+"""
+
+
+@pytest.mark.performance
+def test_saves_are_batched(authenticated_crud_page):
+    """
+    PRUEBA: Cambios seguidos se guardan en una sola escritura (Rendimiento)
+    
+    Verifica que varias creaciones seguidas no escriban en el
+    almacenamiento una vez cada una, sino en un solo guardado posterior.
+    """
+    page = authenticated_crud_page
+    page.seed_records(build_records(500))
+    
+    result = page.driver.execute_async_script(COUNT_RECORD_WRITES_SCRIPT, 20)
+    print(f"20 creaciones con 500 registros: {result}")
+    
+    assert "error" not in result, f"El guardado falló: {result.get('error')}"
+    assert result["writes_before_flush"] == 0, "Las creaciones escribieron de forma síncrona"
+    assert result["writes"] == 1, f"Se esperaba 1 escritura, hubo {result['writes']}"
+    
+    if result["backend"] == "indexedDB":
+        # IndexedDB escribe solo los registros modificados, no los 500
+        assert result["records_written"] <= 20, "Se reescribieron registros sin cambios"
+    
+    stored = page.snapshot_records()
+    assert len(stored) == 520, "No se guardaron todos los registros"
+
+
+# Crea registros uno tras otro (varios por milisegundo) y verifica sus IDs
+CREATE_BURST_SCRIPT = """
+const manager = window.recordManager;
+const count = arguments[0];
+
+const start = performance.now();
+for (let i = 0; i < count; i++) {
+    manager.createRecord({name: 'Ráfaga ' + i, description: '', category: '', date: ''});
+}
+const elapsedMs = performance.now() - start;
+
+const ids = manager.records.map(r => r.id);
+let sorted = true;
+for (let i = 1; i < manager.sortedIds.length; i++) {
+    if (Number(manager.sortedIds[i - 1]) <= Number(manager.sortedIds[i])) sorted = false;
+}
+return {
+    elapsed_ms: elapsedMs,
+    total: ids.length,
+    unique: new Set(ids).size,
+    sorted: sorted
+};
+"""
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("count", [
+    2000,
+    # Prueba de estrés completa: pesada para la ejecución por defecto
+    pytest.param(10000, marks=pytest.mark.timing),
+])
+def test_burst_creation_ids_are_unique(authenticated_crud_page, count):
+    """
+    PRUEBA: Registros creados seguidos tienen IDs únicos (Rendimiento)
+    
+    Verifica que crear registros en ráfaga, muchos en el mismo
+    milisegundo, genere IDs únicos, crecientes y que se guarden todos.
+    El caso de 10000 registros solo corre con --run-benchmarks.
+    """
+    page = authenticated_crud_page
+    
+    result = page.execute_script(CREATE_BURST_SCRIPT, count)
+    print(f"{count} creaciones seguidas: {result['elapsed_ms']:.0f} ms")
+    
+    assert result["total"] == count
+    assert result["unique"] == count, f"Hay {count - result['unique']} IDs repetidos"
+    assert result["sorted"], "Los IDs no están en orden estrictamente decreciente en la tabla"
+    
+    assert len(page.snapshot_records()) == count, "No se guardaron todos los registros"
+    page.refresh_page()
+    assert page.get_total_count() == count, "Se perdieron registros al recargar"
+
+
+# Compara el escape con un <div> temporal (implementación anterior) y el
+# escape sobre strings en los tres campos de texto de cada fila
+COMPARE_ESCAPE_SCRIPT = """
+const manager = window.recordManager;
+const count = arguments[0];
+const escapeWithDiv = text => {
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+};
+const escapeWithString = text => manager.escapeHtml(text);
+
+const records = Array.from({length: count}, (_, i) => ({
+    name: 'Registro <' + i + '>',
+    description: i % 2 ? 'Descripción & "comillas" \\'simples\\'' : '',
+    category: 'Trabajo'
+}));
+const measure = escape => {
+    const start = performance.now();
+    for (const r of records) {
+        escape(r.name);
+        escape(r.description);
+        escape(r.category);
+    }
+    return performance.now() - start;
+};
+
+// Calentamiento para que ambas funciones estén optimizadas
+measure(escapeWithDiv);
+measure(escapeWithString);
+
+const divMs = measure(escapeWithDiv);
+const stringMs = measure(escapeWithString);
+
+// Ambos escapes deben mostrar exactamente el mismo texto
+const probe = document.createElement('div');
+let mismatches = 0;
+for (const r of records.slice(0, 1000)) {
+    probe.innerHTML = escapeWithString(r.name) + '|' + escapeWithString(r.description);
+    if (probe.textContent !== r.name + '|' + r.description) mismatches++;
+}
+
+return {div_ms: divMs, string_ms: stringMs, mismatches: mismatches};
+"""
+
+
+@pytest.mark.performance
+@pytest.mark.timing
+def test_string_escape_faster_than_div(authenticated_crud_page):
+    """
+    PRUEBA: Escape de HTML sin crear nodos del DOM (Rendimiento)
+    
+    Compara en 10000 filas el escape con un <div> temporal y el escape
+    sobre strings, que debe ser más rápido y mostrar el mismo texto.
+    """
+    page = authenticated_crud_page
+    
+    result = page.execute_script(COMPARE_ESCAPE_SCRIPT, 10000)
+    print(f"Escape de 10000 filas - div: {result['div_ms']:.1f} ms, string: {result['string_ms']:.1f} ms")
+    
+    assert result["mismatches"] == 0, "El escape sobre strings cambia el texto mostrado"
+    assert result["string_ms"] < result["div_ms"], \
+        "El escape sobre strings no es más rápido que el de <div>"
+
+
+# Mide (mediana y máximo en ms) buscar en el índice y calcular las filas
+# que coinciden, y por separado aplicar la búsqueda a la tabla
+MEASURE_SEARCH_SCRIPT = """
+const manager = window.recordManager;
+const terms = arguments[0];
+const runs = arguments[1];
+const median = values => values.slice().sort((a, b) => a - b)[Math.floor(values.length / 2)];
+const filterTimes = [];
+const applyTimes = [];
+const results = {};
+
+for (let run = 0; run < runs; run++) {
+    for (const term of terms) {
+        let start = performance.now();
+        manager.searchTerm = term;
+        manager.filterRecords();
+        filterTimes.push(performance.now() - start);
+
+        start = performance.now();
+        results[term] = manager.applySearch(term);
+        applyTimes.push(performance.now() - start);
+    }
+}
+manager.applySearch('');
+
+return {
+    filter_median: median(filterTimes),
+    filter_max: Math.max(...filterTimes),
+    apply_median: median(applyTimes),
+    results: results
+};
+"""
+
+
+@pytest.mark.performance
+@pytest.mark.timing
+def test_search_filter_latency(authenticated_crud_page):
+    """
+    PRUEBA: Buscar en 50000 registros toma menos de un frame (Rendimiento)
+    
+    Verifica que el índice de búsqueda encuentre y ordene los registros
+    que coinciden en menos de 16 ms con 50000 registros cargados.
+    """
+    page = authenticated_crud_page
+    categories = ["Trabajo", "Personal", "Estudio"]
+    page.seed_records([
+        {"name": f"Registro {i}", "description": f"Descripción {i}", "category": categories[i % 3]}
+        for i in range(50000)
+    ])
+    
+    terms = ["Registro 4999", "descripcion 123", "personal", "no existe", "12"]
+    result = page.execute_script(MEASURE_SEARCH_SCRIPT, terms, 5)
+    print(f"Búsqueda en 50000 registros: {result}")
+    
+    assert result["results"]["Registro 4999"] == 11
+    assert result["results"]["no existe"] == 0
+    assert result["filter_median"] < 16, \
+        f"La búsqueda tarda más de un frame: {result['filter_median']:.2f} ms"
+    assert page.get_total_count() == 50000
+
+
+@pytest.mark.performance
+def test_command_trace_counts_round_trips(authenticated_crud_page):
+    """
+    PRUEBA: El trazador atribuye los comandos WebDriver al Page Object (Rendimiento)
+    
+    Verifica que cada comando emitido por get_total_count quede registrado
+    con su localizador y el método del Page Object que lo originó.
+    """
+    page = authenticated_crud_page
+    tracer = get_command_tracer()
+    if not tracer.enabled:
+        pytest.skip("Trazado de comandos desactivado (--no-command-trace)")
+    
+    tracer.start_test()
+    assert page.get_total_count() == 0
+    
+    callers = {record.caller for record in tracer.records}
+    assert callers == {"CRUDPage.get_total_count"}, f"Llamadores: {callers}"
+    assert all(record.locator == "css selector=[id=\"total-count\"]" for record in tracer.records), \
+        f"Localizadores: {[record.locator for record in tracer.records]}"
+    
+    summary = tracer.summary()
+    print(f"get_total_count: {summary['total']} comandos, {summary['by_command']}")
+    assert summary["by_caller"][0]["count"] == summary["total"]
+
+
+@pytest.mark.performance
+def test_negative_checks_answer_immediately(authenticated_crud_page):
+    """
+    PRUEBA: Las comprobaciones de ausencia no esperan el timeout (Rendimiento)
+    
+    Verifica que, con la página asentada, preguntar por modales, alertas o
+    filas que no existen responda con una sola consulta al navegador, sin
+    volver a consultar hasta el timeout.
+    """
+    page = authenticated_crud_page
+    tracer = get_command_tracer()
+    if not tracer.enabled:
+        pytest.skip("Trazado de comandos desactivado (--no-command-trace)")
+    page.wait_until_settled()
+    
+    checks = {
+        "is_modal_visible": page.is_modal_visible,
+        "is_delete_modal_visible": page.is_delete_modal_visible,
+        "is_alert_visible": page.is_alert_visible,
+        "get_table_rows": page.get_table_rows,
+    }
+    for name, check in checks.items():
+        tracer.start_test()
+        result = check()
+        commands = [record.command for record in tracer.records]
+        print(f"{name}: {commands}")
+        
+        assert not result, f"{name} debería ser negativo en una tabla vacía"
+        assert len(commands) == 1, f"{name} volvió a consultar con la página asentada: {commands}"
+    
+    assert page.is_empty_state_visible(), "Debería mostrarse el estado vacío"
+
+
+@pytest.mark.performance
+def test_static_element_reads_use_cache(authenticated_crud_page):
+    """
+    PRUEBA: Leer elementos estáticos reutiliza el elemento localizado (Rendimiento)
+    
+    Verifica que leer varias veces #total-count busque el elemento una sola
+    vez y que, tras recargar la página, se vuelva a buscar.
+    """
+    page = authenticated_crud_page
+    tracer = get_command_tracer()
+    if not tracer.enabled:
+        pytest.skip("Trazado de comandos desactivado (--no-command-trace)")
+    
+    tracer.start_test()
+    counts = [page.get_total_count() for _ in range(5)]
+    commands = [record.command for record in tracer.records]
+    print(f"5 lecturas de #total-count: {commands}")
+    
+    assert counts == [0] * 5
+    assert commands.count("findElement") == 1, f"Comandos: {commands}"
+    assert len(commands) == 6, "Cada lectura después de la primera debería ser un solo comando"
+    
+    page.seed_records([{"name": "Registro en caché"}])
+    assert page.get_total_count() == 1, "Tras recargar debería leerse el contador nuevo"
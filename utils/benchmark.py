@@ -0,0 +1,214 @@
+"""
+benchmark.py - Registro de micro-benchmarks y comparación con una línea base
+
+Cada medición guarda sus muestras (ms) por operación y tamaño del conjunto
+de datos. Al terminar la sesión los resultados se escriben en JSON; si se
+indica una línea base (un JSON de una ejecución anterior), cada medición
+cuya mediana empeore más que el umbral se reporta como regresión.
+"""
+
+import json
+import platform
+import statistics
+import time
+from datetime import datetime
+from pathlib import Path
+
+from utils.tracing import percentile
+
+
+# Tamaños de los conjuntos de datos precargados
+BENCHMARK_SIZES = (10, 100, 1000, 10000)
+
+# Resultados de la ejecución actual
+DEFAULT_RESULTS_PATH = Path(__file__).resolve().parent.parent / "reports" / "benchmarks" / "results.json"
+
+# Diferencias menores a esto (ms) se consideran ruido aunque superen el umbral
+MIN_REGRESSION_MS = 2.0
+
+
+def benchmark_key(name, size):
+    """
+    Clave de una medición en el JSON de resultados
+
+    Args:
+        name: Nombre de la operación
+        size: Número de registros precargados
+
+    Returns:
+        Clave "operacion[tamaño]"
+    """
+    return f"{name}[{size}]"
+
+
+class BenchmarkRecorder:
+    """
+    Acumula las mediciones de la sesión y las compara con la línea base
+    """
+
+    def __init__(self, baseline_path=None, threshold=0.25):
+        """
+        Args:
+            baseline_path: JSON de resultados de referencia (None para no comparar)
+            threshold: Empeoramiento relativo de la mediana que cuenta como
+                regresión (0.25 = 25 % más lento)
+        """
+        self.threshold = threshold
+        self.results = {}
+        self.baseline_path = baseline_path
+        self.baseline = self._load(baseline_path) if baseline_path else {}
+
+    def measure(self, name, size, operation, rounds=5, before_each=None, after_each=None):
+        """
+        Mide una operación varias veces
+
+        Solo se cronometra operation(i); before_each(i) y after_each(i)
+        preparan y limpian cada ronda fuera de la medición.
+
+        Args:
+            name: Nombre de la operación
+            size: Número de registros precargados
+            operation: Función que recibe el número de ronda
+            rounds: Número de rondas
+            before_each: Función opcional que se ejecuta antes de cada ronda
+            after_each: Función opcional que se ejecuta después de cada ronda
+
+        Returns:
+            Resultado registrado (ver add())
+        """
+        samples = []
+        for i in range(rounds):
+            if before_each:
+                before_each(i)
+            start = time.perf_counter()
+            operation(i)
+            samples.append((time.perf_counter() - start) * 1000)
+            if after_each:
+                after_each(i)
+        return self.add(name, size, samples)
+
+    def add(self, name, size, samples):
+        """
+        Registra las muestras de una operación
+
+        Args:
+            name: Nombre de la operación
+            size: Número de registros precargados
+            samples: Duraciones en ms
+
+        Returns:
+            Diccionario con name, size, rounds, median_ms, mean_ms, min_ms, p95_ms y samples_ms
+        """
+        result = {
+            "name": name,
+            "size": size,
+            "rounds": len(samples),
+            "median_ms": statistics.median(samples),
+            "mean_ms": statistics.fmean(samples),
+            "min_ms": min(samples),
+            "p95_ms": percentile(samples, 0.95),
+            "samples_ms": list(samples),
+        }
+        self.results[benchmark_key(name, size)] = result
+        return result
+
+    def merge(self, results):
+        """
+        Agrega los resultados registrados en otro proceso de pytest-xdist
+
+        Args:
+            results: Diccionario clave -> resultado (el atributo results del otro registro)
+        """
+        self.results.update(results)
+
+    def regressions(self, results):
+        """
+        Compara resultados con la línea base
+
+        Args:
+            results: Resultados registrados con add()/measure()
+
+        Returns:
+            Lista de mensajes, uno por regresión (vacía si no hay línea base)
+        """
+        messages = []
+        for result in results:
+            reference = self.baseline.get(benchmark_key(result["name"], result["size"]))
+            if reference is None:
+                continue
+
+            base = reference["median_ms"]
+            current = result["median_ms"]
+            if current > base * (1 + self.threshold) and current - base > MIN_REGRESSION_MS:
+                messages.append(
+                    f"{benchmark_key(result['name'], result['size'])}: "
+                    f"{current:.1f} ms vs {base:.1f} ms en la línea base "
+                    f"(+{current / base - 1:.0%}, umbral {self.threshold:.0%})"
+                )
+        return messages
+
+    def save(self, path=DEFAULT_RESULTS_PATH):
+        """
+        Escribe los resultados en JSON (sirve como línea base de una
+        ejecución posterior)
+
+        Args:
+            path: Ruta del archivo
+
+        Returns:
+            Ruta escrita, o None si no hay resultados
+        """
+        if not self.results:
+            return None
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "baseline": str(self.baseline_path) if self.baseline_path else None,
+            "threshold": self.threshold,
+            "results": self.results,
+        }
+        with open(path, "w", encoding="utf-8") as results_file:
+            json.dump(data, results_file, indent=2, ensure_ascii=False)
+        return path
+
+    def _load(self, path):
+        with open(path, encoding="utf-8") as baseline_file:
+            return json.load(baseline_file).get("results", {})
+
+
+_recorder = None
+
+
+def get_benchmark_recorder():
+    """
+    Obtiene el registro de benchmarks de la sesión
+
+    Returns:
+        BenchmarkRecorder
+    """
+    global _recorder
+    if _recorder is None:
+        _recorder = BenchmarkRecorder()
+    return _recorder
+
+
+def configure_benchmark_recorder(baseline_path=None, threshold=0.25):
+    """
+    Reemplaza el registro de benchmarks de la sesión
+
+    Args:
+        baseline_path: JSON de resultados de referencia (None para no comparar)
+        threshold: Empeoramiento relativo de la mediana que cuenta como regresión
+
+    Returns:
+        BenchmarkRecorder configurado
+    """
+    global _recorder
+    _recorder = BenchmarkRecorder(baseline_path, threshold)
+    return _recorder
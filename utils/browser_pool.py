@@ -0,0 +1,165 @@
+"""
+browser_pool.py - Pool de navegadores reutilizables para la sesión de pruebas
+
+Mantiene instancias de Chrome "calientes" durante toda la sesión de pytest
+para evitar el costo de arrancar Chrome y chromedriver en cada prueba.
+Entre pruebas cada instancia se restablece a un estado limpio.
+"""
+
+from collections import deque
+
+from selenium.common.exceptions import NoAlertPresentException
+
+
+# Página neutra a la que vuelve cada navegador al ser liberado
+BLANK_PAGE = "about:blank"
+
+# Limpia el almacenamiento del origen de la página actual (file:// en la app):
+# localStorage, sessionStorage y bases IndexedDB. Es asíncrono porque borrar
+# una base IndexedDB lo es. Antes espera a que la app termine de guardar sus
+# cambios pendientes (flushRecords); si no, esa escritura terminaría después
+# de limpiar y volvería a llenar el almacenamiento.
+CLEAR_STORAGE_SCRIPT = """
+const done = arguments[arguments.length - 1];
+
+const deleteDatabase = name => new Promise(resolve => {
+    const request = indexedDB.deleteDatabase(name);
+    // onblocked: la página cierra su conexión en onversionchange y el borrado sigue
+    request.onsuccess = request.onerror = request.onblocked = () => resolve();
+});
+
+(async () => {
+    if (window.recordManager) {
+        try { await window.recordManager.flushRecords(); } catch (e) {}
+    }
+    try { window.localStorage.clear(); } catch (e) {}
+    try { window.sessionStorage.clear(); } catch (e) {}
+
+    const databases = await indexedDB.databases();
+    await Promise.all(databases.map(database => deleteDatabase(database.name)));
+})().then(() => done(true), () => done(false));
+"""
+
+
+class BrowserPool:
+    """
+    Pool de instancias de WebDriver reutilizadas entre pruebas
+    """
+
+    def __init__(self, factory, size=1):
+        """
+        Args:
+            factory: Función sin argumentos que crea un WebDriver nuevo
+            size: Número de instancias que se mantienen calientes
+        """
+        self.factory = factory
+        self.size = max(1, int(size))
+        self._idle = deque()
+        self._in_use = set()
+
+    def warm(self):
+        """
+        Arranca instancias hasta completar el tamaño del pool
+        """
+        while len(self._idle) + len(self._in_use) < self.size:
+            self._idle.append(self.factory())
+
+    def acquire(self):
+        """
+        Entrega un navegador sano y listo para usar
+
+        Returns:
+            WebDriver restablecido
+        """
+        while self._idle:
+            driver = self._idle.popleft()
+            if self.is_healthy(driver):
+                self._in_use.add(driver)
+                return driver
+            self._discard(driver)
+
+        driver = self.factory()
+        self._in_use.add(driver)
+        return driver
+
+    def release(self, driver):
+        """
+        Devuelve un navegador al pool después de restablecerlo
+
+        Si el navegador falló o el pool ya está completo, se cierra.
+
+        Args:
+            driver: WebDriver entregado previamente por acquire()
+        """
+        self._in_use.discard(driver)
+
+        if not self.reset(driver) or len(self._idle) >= self.size:
+            self._discard(driver)
+            return
+
+        self._idle.append(driver)
+
+    def reset(self, driver):
+        """
+        Deja el navegador en estado limpio: sin alertas, ventanas extra,
+        almacenamiento ni cookies, y en about:blank
+
+        Args:
+            driver: WebDriver a restablecer
+
+        Returns:
+            True si el restablecimiento fue exitoso
+        """
+        try:
+            self._dismiss_alert(driver)
+            self._close_extra_windows(driver)
+            driver.execute_async_script(CLEAR_STORAGE_SCRIPT)
+            driver.delete_all_cookies()
+            driver.get(BLANK_PAGE)
+            return True
+        except Exception:
+            # Un chromedriver caído produce errores de conexión, no de WebDriver
+            return False
+
+    def is_healthy(self, driver):
+        """
+        Verifica que el navegador siga respondiendo
+
+        Args:
+            driver: WebDriver a verificar
+
+        Returns:
+            True si el navegador responde a comandos
+        """
+        try:
+            return driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    def shutdown(self):
+        """
+        Cierra todas las instancias del pool
+        """
+        for driver in list(self._idle) + list(self._in_use):
+            self._discard(driver)
+        self._idle.clear()
+        self._in_use.clear()
+
+    def _dismiss_alert(self, driver):
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+
+    def _close_extra_windows(self, driver):
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+    def _discard(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
@@ -0,0 +1,147 @@
+"""
+driver_profiles.py - Perfiles de lanzamiento de Chrome
+
+Cada perfil define los flags con los que se arranca Chrome:
+- headed: ventana visible y maximizada (comportamiento original)
+- headless: modo headless nuevo de Chrome, sin ventana
+- minimal: headless sin imágenes, animaciones, red en segundo plano ni extensiones
+"""
+
+import os
+import shutil
+
+from selenium.webdriver.chrome.options import Options
+
+
+DEFAULT_PROFILE = "headed"
+
+# Variable de entorno alternativa a --browser-profile
+PROFILE_ENV_VAR = "BROWSER_PROFILE"
+
+# Variable de entorno para forzar la ruta del ejecutable de Chrome
+BINARY_ENV_VAR = "CHROME_BINARY"
+
+# Flags comunes a todos los perfiles
+COMMON_ARGUMENTS = [
+    "--disable-extensions",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+]
+
+HEADLESS_ARGUMENTS = [
+    "--headless=new",
+    "--window-size=1920,1080",
+]
+
+PROFILES = {
+    "headed": {
+        "arguments": ["--start-maximized"],
+        "prefs": {},
+    },
+    "headless": {
+        "arguments": HEADLESS_ARGUMENTS,
+        "prefs": {},
+    },
+    "minimal": {
+        "arguments": HEADLESS_ARGUMENTS + [
+            "--disable-gpu",
+            "--blink-settings=imagesEnabled=false",
+            "--force-prefers-reduced-motion",
+            "--disable-background-networking",
+            "--disable-component-update",
+            "--disable-default-apps",
+            "--disable-sync",
+            "--no-first-run",
+            "--mute-audio",
+        ],
+        "prefs": {
+            "profile.managed_default_content_settings.images": 2,
+        },
+    },
+}
+
+# Ubicaciones habituales del ejecutable de Chrome por sistema operativo
+CHROME_PATHS = [
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+CHROME_EXECUTABLES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+]
+
+
+def resolve_profile_name(cli_value=None):
+    """
+    Determina el perfil a usar: opción de línea de comandos, variable de
+    entorno o perfil por defecto
+
+    Args:
+        cli_value: Valor de --browser-profile (o None)
+
+    Returns:
+        Nombre de un perfil existente
+    """
+    name = cli_value or os.environ.get(PROFILE_ENV_VAR) or DEFAULT_PROFILE
+    if name not in PROFILES:
+        raise ValueError(
+            f"Perfil de navegador desconocido: '{name}'. Opciones: {', '.join(PROFILES)}"
+        )
+    return name
+
+
+def resolve_chrome_binary():
+    """
+    Busca el ejecutable de Chrome en Windows, macOS y Linux
+
+    Returns:
+        Ruta del ejecutable, o None para que Selenium Manager lo resuelva
+    """
+    configured = os.environ.get(BINARY_ENV_VAR)
+    if configured:
+        return configured
+
+    for path in CHROME_PATHS:
+        if os.path.exists(path):
+            return path
+
+    for executable in CHROME_EXECUTABLES:
+        path = shutil.which(executable)
+        if path:
+            return path
+
+    return None
+
+
+def build_chrome_options(profile_name, profile_dir=None):
+    """
+    Construye las opciones de Chrome para un perfil
+
+    Args:
+        profile_name: Nombre del perfil (ver PROFILES)
+        profile_dir: Directorio user-data-dir propio de la instancia
+
+    Returns:
+        Options de Chrome
+    """
+    profile = PROFILES[profile_name]
+    options = Options()
+
+    for argument in COMMON_ARGUMENTS + profile["arguments"]:
+        options.add_argument(argument)
+
+    if profile["prefs"]:
+        options.add_experimental_option("prefs", profile["prefs"])
+
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+
+    binary = resolve_chrome_binary()
+    if binary:
+        options.binary_location = binary
+
+    return options
@@ -0,0 +1,395 @@
+"""
+screenshots.py - Captura de pantallas con escritura en segundo plano
+
+El hilo de la prueba solo paga la captura dentro del navegador
+(get_screenshot_as_base64). Decodificar, comprimir y escribir el PNG se
+hace en un pool de hilos que se vacía al terminar la sesión.
+
+La política de captura decide qué se guarda:
+- always: cada captura se escribe en disco
+- on-failure: se guardan en memoria las últimas K capturas de la prueba
+  y solo se escriben si la prueba falla
+- never: no se toman capturas
+
+Las capturas se guardan por contenido: cada imagen se identifica por su
+hash y se escribe una sola vez en objects/, e index.json relaciona cada
+prueba (nodeid) y paso con el hash de su última captura.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow no instalado: se escribe el PNG sin recomprimir
+    Image = None
+
+from utils.timing import get_phase_timer
+
+
+logger = logging.getLogger(__name__)
+
+SCREENSHOTS_DIR = Path(__file__).resolve().parent.parent / "reports" / "screenshots"
+
+
+class ScreenshotWriter:
+    """
+    Escribe capturas en disco desde un pool de hilos
+    """
+
+    def __init__(self, max_workers=2, optimize=True):
+        """
+        Args:
+            max_workers: Número de hilos de escritura
+            optimize: Si debe recomprimir el PNG con Pillow
+        """
+        self.max_workers = max_workers
+        self.optimize = optimize and Image is not None
+        self._executor = None
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def submit(self, path, png_base64):
+        """
+        Encola la escritura de una captura
+
+        Args:
+            path: Ruta destino del PNG
+            png_base64: Captura codificada en base64
+
+        Returns:
+            Future de la escritura
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="screenshot-writer"
+                )
+            future = self._executor.submit(self._write, Path(path), png_base64)
+            self._pending.append(future)
+        return future
+
+    def flush(self):
+        """
+        Espera a que terminen todas las escrituras pendientes
+
+        Returns:
+            Lista de excepciones ocurridas durante la escritura
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        errors = []
+        for future in pending:
+            error = future.exception()
+            if error is not None:
+                logger.warning("No se pudo guardar una captura: %s", error)
+                errors.append(error)
+        return errors
+
+    def shutdown(self):
+        """
+        Vacía la cola y detiene los hilos de escritura
+
+        Returns:
+            Lista de excepciones ocurridas durante la escritura
+        """
+        errors = self.flush()
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        return errors
+
+    def _write(self, path, png_base64):
+        data = base64.b64decode(png_base64)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Se escribe en un temporal propio del proceso y del hilo y se mueve
+        # al final: una ejecución interrumpida o dos procesos de xdist con
+        # la misma captura nunca dejan un PNG truncado en su ruta definitiva
+        temp_path = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            if self.optimize:
+                with Image.open(BytesIO(data)) as image:
+                    image.save(temp_path, format="PNG", optimize=True)
+            else:
+                temp_path.write_bytes(data)
+            os.replace(temp_path, path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+
+class ScreenshotStore:
+    """
+    Almacén de capturas direccionado por contenido
+
+    Las capturas idénticas (por ejemplo el mismo paso en varias ejecuciones)
+    comparten un único archivo objects/<hh>/<hash>.png.
+    """
+
+    def __init__(self, root=SCREENSHOTS_DIR, writer=None):
+        """
+        Args:
+            root: Carpeta de capturas
+            writer: ScreenshotWriter usado para escribir en disco
+        """
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.index_path = self.root / "index.json"
+        self.writer = writer or get_screenshot_writer()
+        self._index = {}
+        self._stored = set()
+        self._lock = threading.Lock()
+
+    def object_path(self, digest):
+        """
+        Ruta del archivo de una captura según su hash
+
+        Args:
+            digest: Hash SHA-256 en hexadecimal
+
+        Returns:
+            Path del objeto
+        """
+        return self.objects_dir / digest[:2] / f"{digest}.png"
+
+    def put(self, test_id, step, png_base64):
+        """
+        Guarda una captura si su contenido no existe todavía
+
+        Args:
+            test_id: nodeid de pytest de la prueba (distingue los casos parametrizados)
+            step: Nombre del paso de prueba (por ejemplo "create_01_pagina_inicial")
+            png_base64: Captura codificada en base64
+
+        Returns:
+            Ruta (futura) del objeto
+        """
+        digest = hashlib.sha256(png_base64.encode("ascii")).hexdigest()
+        path = self.object_path(digest)
+
+        with self._lock:
+            self._index.setdefault(test_id, {})[step] = digest
+            is_new = digest not in self._stored
+            self._stored.add(digest)
+
+        if is_new and not path.exists():
+            self.writer.submit(path, png_base64)
+        return str(path)
+
+    def save_index(self, worker_id="master"):
+        """
+        Escribe el índice de la sesión
+
+        Con pytest-xdist cada proceso escribe solo su fragmento
+        (index-gwN.json) sin leer el índice común; el proceso principal
+        ("master") combina index.json, los fragmentos y su propio índice, y
+        borra los fragmentos. Cada prueba reemplaza completa su entrada
+        anterior.
+
+        Args:
+            worker_id: ID del proceso de pytest-xdist ("master" si se ejecuta en serie)
+        """
+        with self._lock:
+            session_index = dict(self._index)
+
+        if worker_id != "master":
+            if session_index:
+                self._write_json(self.root / f"index-{worker_id}.json", session_index)
+            return
+
+        shards = sorted(self.root.glob("index-*.json"))
+        if not session_index and not shards:
+            return
+
+        index = self._read_json(self.index_path)
+        for shard in shards:
+            index.update(self._read_json(shard))
+        index.update(session_index)
+        self._write_json(self.index_path, index)
+
+        for shard in shards:
+            shard.unlink(missing_ok=True)
+
+    def _write_json(self, path, data):
+        self.root.mkdir(parents=True, exist_ok=True)
+        # Escritura atómica: no deja archivos a medio escribir si el proceso se corta
+        temp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(temp_path, path)
+
+    def _read_json(self, path):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        # Solo entradas prueba -> {paso: hash}; descarta el formato anterior paso -> hash
+        return {key: value for key, value in data.items() if isinstance(value, dict)}
+
+
+class CapturePolicy:
+    """
+    Decide qué capturas se escriben en disco según el modo configurado
+    """
+
+    MODES = ("always", "on-failure", "never")
+
+    def __init__(self, mode="always", buffer_size=5, store=None):
+        """
+        Args:
+            mode: always, on-failure o never
+            buffer_size: Capturas recientes que se conservan en modo on-failure
+            store: ScreenshotStore donde se guardan las capturas
+        """
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Política de capturas desconocida: '{mode}'. Opciones: {', '.join(self.MODES)}"
+            )
+        self.mode = mode
+        self.store = store or get_screenshot_store()
+        self._buffer = deque(maxlen=max(1, int(buffer_size)))
+        # Prueba en curso y capturas guardadas durante ella: (paso, ruta)
+        self.test_id = None
+        self.saved = []
+
+    def start_test(self, test_id):
+        """
+        Descarta las capturas en memoria de la prueba anterior
+
+        Args:
+            test_id: nodeid de pytest de la prueba que empieza
+        """
+        self.test_id = test_id
+        self._buffer.clear()
+        self.saved = []
+
+    def capture(self, driver, name):
+        """
+        Toma una captura según la política
+
+        Args:
+            driver: WebDriver del que se captura la pantalla
+            name: Nombre del paso de prueba
+
+        Returns:
+            Ruta (futura) del objeto guardado, o None si no se guarda
+        """
+        if self.mode == "never":
+            return None
+
+        png_base64 = driver.get_screenshot_as_base64()
+
+        if self.mode == "always":
+            return self._save(name, png_base64)
+
+        self._buffer.append((name, png_base64))
+        return None
+
+    def persist_buffer(self):
+        """
+        Escribe en disco las capturas en memoria (la prueba falló)
+
+        Returns:
+            Lista de rutas escritas
+        """
+        paths = []
+        while self._buffer:
+            name, png_base64 = self._buffer.popleft()
+            paths.append(self._save(name, png_base64))
+        return paths
+
+    def discard_buffer(self):
+        """
+        Descarta las capturas en memoria (la prueba pasó)
+        """
+        self._buffer.clear()
+
+    def _save(self, name, png_base64):
+        path = self.store.put(self.test_id, name, png_base64)
+        self.saved.append((name, path))
+        return path
+
+
+_writer = None
+_store = None
+_policy = None
+
+
+def get_screenshot_writer():
+    """
+    Obtiene el escritor de capturas compartido por toda la sesión
+
+    Returns:
+        ScreenshotWriter
+    """
+    global _writer
+    if _writer is None:
+        _writer = ScreenshotWriter()
+    return _writer
+
+
+def get_screenshot_store():
+    """
+    Obtiene el almacén de capturas compartido por toda la sesión
+
+    Returns:
+        ScreenshotStore
+    """
+    global _store
+    if _store is None:
+        _store = ScreenshotStore()
+    return _store
+
+
+def get_capture_policy():
+    """
+    Obtiene la política de captura de la sesión (always por defecto)
+
+    Returns:
+        CapturePolicy
+    """
+    global _policy
+    if _policy is None:
+        _policy = CapturePolicy()
+    return _policy
+
+
+def configure_capture_policy(mode, buffer_size=5):
+    """
+    Reemplaza la política de captura de la sesión
+
+    Args:
+        mode: always, on-failure o never
+        buffer_size: Capturas recientes que se conservan en modo on-failure
+
+    Returns:
+        CapturePolicy configurada
+    """
+    global _policy
+    _policy = CapturePolicy(mode, buffer_size)
+    return _policy
+
+
+def capture_screenshot(driver, name):
+    """
+    Toma una captura según la política de la sesión; la escritura ocurre
+    en el hilo de fondo
+
+    Args:
+        driver: WebDriver del que se captura la pantalla
+        name: Nombre del paso de prueba
+
+    Returns:
+        Ruta (futura) del archivo de captura, o None si no se guarda
+    """
+    with get_phase_timer().phase("screenshot"):
+        return get_capture_policy().capture(driver, name)
@@ -0,0 +1,293 @@
+"""
+timing.py - Desglose del tiempo de cada prueba por fases
+
+Cada fase (obtener el navegador, autenticación, cuerpo de la prueba,
+capturas y liberación del navegador) se mide con PhaseTimer.phase().
+Las fases anidadas se descuentan de la fase que las contiene, así las
+capturas tomadas dentro de la prueba no se cuentan dos veces.
+
+Además del desglose por prueba se acumula un total de la sesión y,
+opcionalmente, los intervalos en formato Chrome Trace (chrome://tracing
+o https://ui.perfetto.dev) para ver la ejecución como línea de tiempo.
+Con pytest-xdist cada proceso exporta sus mediciones con export() y el
+proceso principal las combina con merge().
+"""
+
+import html
+import json
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+
+# Fases conocidas, en el orden en que se reportan
+PHASE_LABELS = {
+    "driver": "Navegador (arranque o pool)",
+    "auth": "Autenticación",
+    "body": "Cuerpo de la prueba",
+    "screenshot": "Capturas",
+    "teardown": "Limpieza y cierre del navegador",
+}
+
+# Tiempo de la prueba que no cae en ninguna fase (pytest, otros fixtures)
+OTHER_PHASE = "other"
+OTHER_LABEL = "Otros"
+
+
+class PhaseTimer:
+    """
+    Mide el tiempo de cada fase de las pruebas
+    """
+
+    def __init__(self, trace=False):
+        """
+        Args:
+            trace: Si debe guardar los intervalos para exportarlos como Chrome Trace
+        """
+        self.trace = trace
+        self.events = []
+        # Tiempo propio por fase de la prueba en curso (segundos)
+        self.durations = defaultdict(float)
+        # Acumulado de la sesión por fase y número de pruebas medidas
+        self.session_totals = defaultdict(float)
+        self.tests = 0
+        self.current = None
+        self._test_start = None
+        # Fases abiertas: [nombre, tiempo de fases hijas]
+        self._stack = []
+        self._origin = time.perf_counter()
+        # Hora de reloj de _origin: alinea las trazas de distintos procesos
+        self._origin_wall = time.time()
+        # PID -> nombre del proceso en la traza
+        self.processes = {os.getpid(): f"pytest {os.environ.get('PYTEST_XDIST_WORKER', 'master')}"}
+
+    def start_test(self, nodeid):
+        """
+        Empieza a medir una prueba
+
+        Args:
+            nodeid: Identificador de pytest de la prueba
+        """
+        self.current = nodeid
+        self.durations = defaultdict(float)
+        self._stack = []
+        self._test_start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Mide una fase; el tiempo de fases anidadas se descuenta de esta
+
+        Args:
+            name: Nombre de la fase (ver PHASE_LABELS)
+        """
+        start = time.perf_counter()
+        self._stack.append([name, 0.0])
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            _, children = self._stack.pop()
+            elapsed = end - start
+            if self._stack:
+                self._stack[-1][1] += elapsed
+
+            self.durations[name] += elapsed - children
+            self.session_totals[name] += elapsed - children
+            self._add_event(name, "phase", start, end)
+
+    def finish_test(self):
+        """
+        Termina de medir la prueba en curso
+
+        Returns:
+            Diccionario fase -> segundos, incluido "other" y "total"
+        """
+        if self._test_start is None:
+            return {}
+
+        end = time.perf_counter()
+        total = end - self._test_start
+        breakdown = dict(self.durations)
+        breakdown[OTHER_PHASE] = max(0.0, total - sum(self.durations.values()))
+        breakdown["total"] = total
+
+        self.session_totals[OTHER_PHASE] += breakdown[OTHER_PHASE]
+        self.tests += 1
+        self._add_event(self.current, "test", self._test_start, end)
+
+        self._test_start = None
+        self.current = None
+        return breakdown
+
+    def session_summary(self):
+        """
+        Acumulado de la sesión por fase
+
+        Returns:
+            Lista de filas {"phase", "label", "total_s", "mean_ms", "share"}
+        """
+        grand_total = sum(self.session_totals.values())
+        rows = []
+        for phase, label in _labels():
+            total = self.session_totals.get(phase, 0.0)
+            rows.append({
+                "phase": phase,
+                "label": label,
+                "total_s": total,
+                "mean_ms": total / self.tests * 1000 if self.tests else 0.0,
+                "share": total / grand_total if grand_total else 0.0,
+            })
+        return rows
+
+    def export(self):
+        """
+        Mediciones de la sesión en un diccionario serializable (para
+        enviarlas desde un proceso de pytest-xdist al principal)
+
+        Returns:
+            Diccionario con session_totals, tests, events, processes y origin
+        """
+        return {
+            "session_totals": dict(self.session_totals),
+            "tests": self.tests,
+            "events": self.events,
+            "processes": {str(pid): name for pid, name in self.processes.items()},
+            "origin": self._origin_wall,
+        }
+
+    def merge(self, data):
+        """
+        Suma las mediciones exportadas por otro proceso
+
+        Args:
+            data: Resultado de export() en el otro proceso
+        """
+        for phase, total in data["session_totals"].items():
+            self.session_totals[phase] += total
+        self.tests += data["tests"]
+
+        # Los intervalos son relativos al inicio de cada proceso
+        shift = (data["origin"] - self._origin_wall) * 1e6
+        self.events.extend(dict(event, ts=event["ts"] + shift) for event in data["events"])
+        self.processes.update({int(pid): name for pid, name in data["processes"].items()})
+
+    def write_chrome_trace(self, path):
+        """
+        Escribe los intervalos medidos en formato Chrome Trace (JSON)
+
+        Args:
+            path: Ruta del archivo JSON
+
+        Returns:
+            Ruta escrita
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": name}}
+            for pid, name in self.processes.items()
+        ]
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump({"traceEvents": metadata + self.events}, trace_file)
+        return path
+
+    def _add_event(self, name, category, start, end):
+        if not self.trace:
+            return
+        self.events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": 0,
+        })
+
+
+def _labels():
+    return list(PHASE_LABELS.items()) + [(OTHER_PHASE, OTHER_LABEL)]
+
+
+def breakdown_html(breakdown):
+    """
+    Tabla HTML con el desglose por fases de una prueba
+
+    Args:
+        breakdown: Resultado de PhaseTimer.finish_test()
+
+    Returns:
+        Fragmento HTML, o None si no hay mediciones
+    """
+    total = breakdown.get("total")
+    if not total:
+        return None
+
+    rows = "".join(
+        f"<tr><td>{html.escape(label)}</td><td>{breakdown.get(phase, 0.0) * 1000:.0f}</td>"
+        f"<td>{breakdown.get(phase, 0.0) / total:.0%}</td></tr>"
+        for phase, label in _labels()
+    )
+    return (
+        f'<div class="phase-timing"><h4>Tiempo por fase ({total * 1000:.0f} ms)</h4>'
+        f"<table><tr><th>Fase</th><th>ms</th><th>%</th></tr>{rows}</table></div>"
+    )
+
+
+def session_summary_html(timer):
+    """
+    Tabla HTML con el acumulado de la sesión por fase
+
+    Args:
+        timer: PhaseTimer de la sesión
+
+    Returns:
+        Fragmento HTML, o None si no se midió ninguna prueba
+    """
+    if not timer.tests:
+        return None
+
+    rows = "".join(
+        f"<tr><td>{html.escape(row['label'])}</td><td>{row['total_s']:.2f}</td>"
+        f"<td>{row['mean_ms']:.0f}</td><td>{row['share']:.0%}</td></tr>"
+        for row in timer.session_summary()
+    )
+    return (
+        f'<div class="phase-timing"><h3>Tiempo por fase ({timer.tests} pruebas)</h3>'
+        f"<table><tr><th>Fase</th><th>Total (s)</th><th>Media por prueba (ms)</th>"
+        f"<th>%</th></tr>{rows}</table></div>"
+    )
+
+
+_timer = None
+
+
+def get_phase_timer():
+    """
+    Obtiene el medidor de fases de la sesión
+
+    Returns:
+        PhaseTimer
+    """
+    global _timer
+    if _timer is None:
+        _timer = PhaseTimer()
+    return _timer
+
+
+def configure_phase_timer(trace=False):
+    """
+    Reemplaza el medidor de fases de la sesión
+
+    Args:
+        trace: Si debe guardar los intervalos para exportarlos como Chrome Trace
+
+    Returns:
+        PhaseTimer configurado
+    """
+    global _timer
+    _timer = PhaseTimer(trace)
+    return _timer
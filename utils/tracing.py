@@ -0,0 +1,261 @@
+"""
+tracing.py - Registro de los comandos WebDriver que emite cada prueba
+
+Cada comando WebDriver es una petición HTTP a chromedriver. El trazador
+envuelve driver.execute y anota, por comando: nombre, localizador, duración
+y el método del Page Object que lo originó. Al terminar la prueba se resume
+en conteos y latencias p50/p95 que se adjuntan al reporte HTML.
+"""
+
+import html
+import math
+import sys
+import time
+from collections import Counter, defaultdict, namedtuple
+from pathlib import Path
+
+
+# Directorio de los Page Objects: sus métodos son los "llamadores" que se reportan
+PAGES_DIR = str(Path(__file__).resolve().parent.parent / "tests" / "pages")
+
+# Comando registrado: duración en segundos, localizador y llamador pueden ser None
+CommandRecord = namedtuple("CommandRecord", "command locator duration caller")
+
+
+def percentile(values, fraction):
+    """
+    Percentil por rango más cercano
+
+    Args:
+        values: Lista de números
+        fraction: Percentil entre 0 y 1 (0.95 para p95)
+
+    Returns:
+        Valor del percentil, o 0 si la lista está vacía
+    """
+    if not values:
+        return 0
+    ordered = sorted(values)
+    index = max(0, math.ceil(fraction * len(ordered)) - 1)
+    return ordered[index]
+
+
+def find_page_object_caller(frame):
+    """
+    Busca el método de Page Object más externo de la pila de llamadas
+
+    Recorre la pila desde el comando hacia la prueba y se queda con el
+    último marco dentro de tests/pages antes de salir de ellos; así
+    get_record_by_name agrupa los find_element que hace internamente.
+
+    Args:
+        frame: Marco desde el que empezar a recorrer
+
+    Returns:
+        Nombre calificado ("CRUDPage.get_record_by_name") o None
+    """
+    caller = None
+    while frame is not None:
+        code = frame.f_code
+        if code.co_filename.startswith(PAGES_DIR):
+            caller = getattr(code, "co_qualname", code.co_name)
+        elif caller is not None:
+            break
+        frame = frame.f_back
+    return caller
+
+
+class CommandTracer:
+    """
+    Registra los comandos WebDriver de la prueba en curso
+    """
+
+    def __init__(self, enabled=True):
+        """
+        Args:
+            enabled: Si debe registrar comandos (si no, install() no hace nada)
+        """
+        self.enabled = enabled
+        self.records = []
+        # ID de elemento WebDriver -> localizador con el que se encontró
+        self._locators = {}
+
+    def install(self, driver):
+        """
+        Envuelve driver.execute para registrar cada comando
+
+        Es idempotente: los navegadores del pool se reutilizan entre pruebas.
+
+        Args:
+            driver: WebDriver a instrumentar
+
+        Returns:
+            El mismo driver
+        """
+        if not self.enabled or getattr(driver, "_command_tracer", None) is self:
+            return driver
+
+        execute = type(driver).execute.__get__(driver)
+
+        def traced_execute(driver_command, params=None):
+            start = time.perf_counter()
+            response = None
+            try:
+                response = execute(driver_command, params)
+                return response
+            finally:
+                self._record(driver_command, params, time.perf_counter() - start, response)
+
+        # Los WebElement también pasan por driver.execute (self._parent.execute)
+        driver.execute = traced_execute
+        driver._command_tracer = self
+        return driver
+
+    def start_test(self):
+        """
+        Descarta los comandos de la prueba anterior
+        """
+        self.records = []
+        self._locators.clear()
+
+    def _record(self, command, params, duration, response):
+        locator = None
+        if params:
+            if "using" in params:
+                locator = f"{params['using']}={params.get('value')}"
+                self._remember_elements(locator, response)
+            elif "id" in params:
+                # Comandos sobre un elemento (click, getText...): su localizador
+                locator = self._locators.get(params["id"])
+
+        self.records.append(CommandRecord(
+            command, locator, duration, find_page_object_caller(sys._getframe(2))
+        ))
+
+    def _remember_elements(self, locator, response):
+        value = response.get("value") if response else None
+        elements = value if isinstance(value, list) else [value]
+        for element in elements:
+            element_id = getattr(element, "id", None)
+            if element_id:
+                self._locators[element_id] = locator
+
+    def summary(self):
+        """
+        Resume los comandos de la prueba
+
+        Returns:
+            Diccionario con total, tiempo total (ms) y filas por comando y por llamador:
+            {"total": n, "total_ms": x, "by_command": [...], "by_caller": [...]}
+        """
+        return {
+            "total": len(self.records),
+            "total_ms": sum(record.duration for record in self.records) * 1000,
+            "by_command": self._group(lambda record: record.command),
+            "by_caller": self._group(lambda record: record.caller or "(fuera de Page Objects)"),
+        }
+
+    def _group(self, key):
+        durations = defaultdict(list)
+        for record in self.records:
+            durations[key(record)].append(record.duration * 1000)
+
+        rows = [
+            {
+                "name": name,
+                "count": len(values),
+                "total_ms": sum(values),
+                "p50_ms": percentile(values, 0.50),
+                "p95_ms": percentile(values, 0.95),
+            }
+            for name, values in durations.items()
+        ]
+        rows.sort(key=lambda row: (-row["count"], row["name"]))
+        return rows
+
+    def top_locators(self, limit=10):
+        """
+        Localizadores con más comandos en la prueba
+
+        Args:
+            limit: Máximo de localizadores a retornar
+
+        Returns:
+            Lista de tuplas (localizador, conteo)
+        """
+        counts = Counter(record.locator for record in self.records if record.locator)
+        return counts.most_common(limit)
+
+    def summary_html(self):
+        """
+        Tablas HTML del resumen para el reporte de pytest-html
+
+        Returns:
+            Fragmento HTML, o None si la prueba no emitió comandos
+        """
+        if not self.records:
+            return None
+
+        summary = self.summary()
+        parts = [
+            f"<h4>Comandos WebDriver: {summary['total']} "
+            f"({summary['total_ms']:.0f} ms)</h4>",
+            _rows_table("Comando", summary["by_command"]),
+            _rows_table("Método del Page Object", summary["by_caller"]),
+        ]
+
+        locators = self.top_locators()
+        if locators:
+            parts.append(
+                "<table><tr><th>Localizador</th><th>Comandos</th></tr>"
+                + "".join(
+                    f"<tr><td>{html.escape(locator)}</td><td>{count}</td></tr>"
+                    for locator, count in locators
+                )
+                + "</table>"
+            )
+        return f'<div class="command-trace">{"".join(parts)}</div>'
+
+
+def _rows_table(title, rows):
+    body = "".join(
+        f"<tr><td>{html.escape(row['name'])}</td><td>{row['count']}</td>"
+        f"<td>{row['total_ms']:.1f}</td><td>{row['p50_ms']:.1f}</td>"
+        f"<td>{row['p95_ms']:.1f}</td></tr>"
+        for row in rows
+    )
+    return (
+        f"<table><tr><th>{title}</th><th>Comandos</th><th>Total (ms)</th>"
+        f"<th>p50 (ms)</th><th>p95 (ms)</th></tr>{body}</table>"
+    )
+
+
+_tracer = None
+
+
+def get_command_tracer():
+    """
+    Obtiene el trazador de comandos de la sesión (activo por defecto)
+
+    Returns:
+        CommandTracer
+    """
+    global _tracer
+    if _tracer is None:
+        _tracer = CommandTracer()
+    return _tracer
+
+
+def configure_command_tracer(enabled=True):
+    """
+    Reemplaza el trazador de comandos de la sesión
+
+    Args:
+        enabled: Si debe registrar comandos
+
+    Returns:
+        CommandTracer configurado
+    """
+    global _tracer
+    _tracer = CommandTracer(enabled)
+    return _tracer